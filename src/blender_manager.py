@@ -10,12 +10,143 @@
 # (at your option) any later version.
 
 import os
+import re
 import sys
-import shutil
-import subprocess
+import codecs
 import logging
 import threading
 
+from src.utils import read_json_file, write_json_file
+
+# Blender输出行的日志级别判断，与日志高亮保持一致：
+# error/exception不加单词边界，以便识别"AttributeError"之类的Python异常名；
+# warn按单词边界匹配，避免"mirrored"之类的误判
+_LEVEL_RE = re.compile(r'(error|exception)|\bwarn', re.IGNORECASE)
+
+
+def _line_level(line, errors_only=False):
+    """判断一行Blender输出的日志级别
+    
+    Args:
+        line: 输出行
+        errors_only: 是否只记录错误和警告
+        
+    Returns:
+        int: 日志级别，不需要记录时返回None
+    """
+    match = _LEVEL_RE.search(line)
+    if match is None:
+        return None if errors_only else logging.INFO
+    return logging.ERROR if match.group(1) else logging.WARNING
+
+
+def _read_pe_version(exe_path):
+    """从Windows可执行文件的VERSIONINFO资源中读取版本号
+    
+    Args:
+        exe_path: 可执行文件路径
+        
+    Returns:
+        str: 形如"Blender 3.6.0"的版本号，无法读取则返回None
+    """
+    if sys.platform != 'win32':
+        return None
+    
+    import ctypes
+    from ctypes import wintypes
+    
+    class VS_FIXEDFILEINFO(ctypes.Structure):
+        _fields_ = [
+            ('dwSignature', wintypes.DWORD),
+            ('dwStrucVersion', wintypes.DWORD),
+            ('dwFileVersionMS', wintypes.DWORD),
+            ('dwFileVersionLS', wintypes.DWORD),
+            ('dwProductVersionMS', wintypes.DWORD),
+            ('dwProductVersionLS', wintypes.DWORD),
+            ('dwFileFlagsMask', wintypes.DWORD),
+            ('dwFileFlags', wintypes.DWORD),
+            ('dwFileOS', wintypes.DWORD),
+            ('dwFileType', wintypes.DWORD),
+            ('dwFileSubtype', wintypes.DWORD),
+            ('dwFileDateMS', wintypes.DWORD),
+            ('dwFileDateLS', wintypes.DWORD),
+        ]
+    
+    version_dll = ctypes.windll.version
+    size = version_dll.GetFileVersionInfoSizeW(exe_path, None)
+    if not size:
+        return None
+    
+    buffer = ctypes.create_string_buffer(size)
+    if not version_dll.GetFileVersionInfoW(exe_path, 0, size, buffer):
+        return None
+    
+    info_ptr = ctypes.c_void_p()
+    length = wintypes.UINT()
+    if not version_dll.VerQueryValueW(buffer, "\\", ctypes.byref(info_ptr), ctypes.byref(length)):
+        return None
+    if length.value < ctypes.sizeof(VS_FIXEDFILEINFO):
+        return None
+    
+    info = ctypes.cast(info_ptr, ctypes.POINTER(VS_FIXEDFILEINFO)).contents
+    if info.dwSignature != 0xFEEF04BD:
+        return None
+    
+    major = info.dwFileVersionMS >> 16
+    minor = info.dwFileVersionMS & 0xFFFF
+    patch = info.dwFileVersionLS >> 16
+    if major == 0 and minor == 0:
+        return None
+    return f"Blender {major}.{minor}.{patch}"
+
+
+def _path_key(path):
+    """返回用于判断路径是否重复的键（Windows下不区分大小写）"""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _scan_blender_dirs(search_dir):
+    """扫描目录下的Blender安装目录
+    
+    Args:
+        search_dir: 搜索目录
+        
+    Returns:
+        list: Blender安装目录路径
+    """
+    join = os.path.join
+    isfile = os.path.isfile
+    with os.scandir(search_dir) as entries:
+        subdirs = [entry.path for entry in entries if entry.is_dir()]
+    return [subdir for subdir in subdirs
+            if isfile(join(subdir, "blender.exe"))]
+
+
+class BlenderInstance:
+    """一次启动的Blender实例
+    
+    以安装路径而不是列表索引标识，删除其他Blender路径不会影响对应关系
+    """
+    
+    __slots__ = ('path', 'version', 'process', 'log_files', 'new_process_group')
+    
+    def __init__(self, path, version, process, log_files=None, new_process_group=False):
+        self.path = path
+        self.version = version
+        self.process = process
+        self.log_files = log_files
+        # 是否以CREATE_NEW_PROCESS_GROUP启动，只有这样的进程才能单独接收CTRL_BREAK_EVENT
+        self.new_process_group = new_process_group
+    
+    @property
+    def pid(self):
+        """进程ID"""
+        return self.process.pid
+    
+    def is_running(self):
+        """进程是否仍在运行"""
+        return self.process.poll() is None
+
 
 class BlenderManager:
     """Blender管理器"""
@@ -24,46 +155,219 @@ class BlenderManager:
         self.config = config or {}
         self.blender_paths = self.config.get('blender_paths', [])
         self.logger = logger or logging.getLogger("BlenderManager")
+        
+        # 正在运行的Blender实例: 安装路径 -> 按启动顺序排列的BlenderInstance列表
+        # 同一个安装可以同时运行多个实例
+        self._instances = {}
+        
+        # 正在后台删除目录的Blender安装（规范化路径）
+        self._uninstalling = set()
+        
+        # 版本缓存: (blender.exe路径, mtime_ns, 文件大小) -> 版本号
+        log_dir = self.config.get('log_config', {}).get('log_dir', 'logs')
+        self._version_cache_file = os.path.join(log_dir, '.version_cache.json')
+        self._version_cache_lock = threading.Lock()
+        self._version_cache_timer = None
+        self._version_cache = self._load_version_cache()
+        
+        # Blender输出日志的格式化器和控制台处理器，每次启动复用
+        self._blender_formatter = logging.Formatter(
+            '%(asctime)s [Blender] [%(levelname)s] %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        self._combined_formatter = logging.Formatter(
+            '%(asctime)s [%(name)s] [%(levelname)s] %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        self._console_handler = logging.StreamHandler()
+        self._console_handler.setFormatter(self._blender_formatter)
+    
+    @property
+    def blender_paths(self):
+        """Blender安装路径列表"""
+        return self._blender_paths
+    
+    @blender_paths.setter
+    def blender_paths(self, paths):
+        # 同时维护一个规范化路径的集合，用于O(1)查重
+        self._blender_paths = paths
+        self._paths_set = {_path_key(path) for path in paths}
+    
+    def _remove_path(self, index):
+        """从列表和查重集合中移除指定索引的路径"""
+        path = self._blender_paths.pop(index)
+        self._paths_set.discard(_path_key(path))
+    
+    def _load_version_cache(self):
+        """从磁盘加载版本缓存
+        
+        Returns:
+            dict: 版本缓存
+        """
+        data = read_json_file(self._version_cache_file, default={})
+        cache = {}
+        for entry in data.get('entries', []):
+            if len(entry) == 4:
+                blender_exe, mtime_ns, size, version = entry
+                cache[(blender_exe, mtime_ns, size)] = version
+        return cache
+    
+    def _store_version(self, cache_key, version):
+        """写入版本缓存，并延迟保存到磁盘
+        
+        Args:
+            cache_key: (blender.exe路径, mtime_ns, 文件大小)
+            version: 版本号
+        """
+        with self._version_cache_lock:
+            # 同一个blender.exe只保留最新的记录
+            for key in [k for k in self._version_cache if k[0] == cache_key[0]]:
+                del self._version_cache[key]
+            self._version_cache[cache_key] = version
+            
+            # 合并短时间内的多次写入
+            if self._version_cache_timer is None:
+                self._version_cache_timer = threading.Timer(1.0, self._flush_version_cache)
+                self._version_cache_timer.daemon = True
+                self._version_cache_timer.start()
+    
+    def save_version_cache(self):
+        """立即保存尚未写入磁盘的版本缓存
+        
+        延迟保存的定时器是守护线程，程序退出前需调用此方法，避免最后一秒内探测到的版本丢失
+        """
+        with self._version_cache_lock:
+            timer = self._version_cache_timer
+        if timer is None:
+            return
+        timer.cancel()
+        self._flush_version_cache()
+    
+    def _flush_version_cache(self):
+        """保存版本缓存到磁盘"""
+        with self._version_cache_lock:
+            self._version_cache_timer = None
+            entries = [[*key, version] for key, version in self._version_cache.items()]
+        write_json_file(self._version_cache_file, {'entries': entries})
     
-    def get_blender_version(self, blender_path):
+    def _get_path(self, index):
+        """按索引获取Blender路径
+        
+        Args:
+            index: Blender索引
+            
+        Returns:
+            str: Blender路径，索引无效时返回None
+        """
+        if index < 0:
+            return None
+        try:
+            return self.blender_paths[index]
+        except IndexError:
+            return None
+    
+    def get_blender_version(self, blender_path, exe_stat=None):
         """获取Blender版本信息
         
         Args:
             blender_path: Blender安装路径
+            exe_stat: 调用方已获取的blender.exe的os.stat结果，避免重复stat
             
         Returns:
             str: Blender版本号，如果无法获取则返回文件夹名
         """
         try:
             blender_exe = os.path.join(blender_path, "blender.exe")
-            if not os.path.exists(blender_exe):
-                self.logger.warning(f"找不到blender.exe: {blender_exe}")
-                return os.path.basename(blender_path)
+            st = exe_stat
+            if st is None:
+                try:
+                    st = os.stat(blender_exe)
+                except OSError:
+                    self.logger.warning("找不到blender.exe: %s", blender_exe)
+                    return os.path.basename(blender_path)
+            
+            # blender.exe未变化时直接使用缓存的版本号
+            cache_key = (blender_exe, st.st_mtime_ns, st.st_size)
+            version = self._version_cache.get(cache_key)
+            if version is not None:
+                return version
+            
+            # 优先读取exe内嵌的版本资源，无需启动进程
+            try:
+                version = _read_pe_version(blender_exe)
+            except Exception as e:
+                self.logger.debug("读取版本资源失败: %s", e)
+                version = None
+            if version:
+                self._store_version(cache_key, version)
+                return version
+            
+            import subprocess
             
             # 调用blender -v获取版本信息
+            # 正常情况下只需要stdout，stderr直接丢弃；-v输出很小，64KB缓冲一次即可读完
             result = subprocess.run(
                 [blender_exe, "-v"],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
+                timeout=5,
+                bufsize=64 * 1024,
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
-            
+
             # 解析输出获取版本号
             if result.returncode == 0:
                 version_line = result.stdout.split('\n')[0]
                 if "Blender" in version_line:
                     # 通常格式为: "Blender 3.6.0"
-                    return version_line.strip()
-                self.logger.warning(f"无法从输出中解析Blender版本: {version_line}")
+                    version = version_line.strip()
+                    self._store_version(cache_key, version)
+                    return version
+                self.logger.warning("无法从输出中解析Blender版本: %s", version_line)
             else:
-                self.logger.warning(f"获取Blender版本失败: {result.stderr}")
+                # 失败时才重新运行一次以获取stderr用于日志
+                error_result = subprocess.run(
+                    [blender_exe, "-v"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=5,
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                )
+                self.logger.warning("获取Blender版本失败: %s", error_result.stderr)
             
             return os.path.basename(blender_path)
         except Exception as e:
-            self.logger.error(f"获取Blender版本时出错: {str(e)}")
+            self.logger.error("获取Blender版本时出错: %s", e)
             return os.path.basename(blender_path)
     
+    def get_blender_versions(self, blender_paths):
+        """并行获取多个Blender的版本信息
+        
+        Args:
+            blender_paths: Blender安装路径列表
+            
+        Returns:
+            list: 与blender_paths顺序一致的版本号列表
+        """
+        versions = [None] * len(blender_paths)
+        if not blender_paths:
+            return versions
+        
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        # 每次探测都是等待子进程的I/O，限制线程数避免同时启动过多进程
+        with ThreadPoolExecutor(max_workers=min(8, len(blender_paths))) as executor:
+            futures = {
+                executor.submit(self.get_blender_version, path): i
+                for i, path in enumerate(blender_paths)
+            }
+            for future in as_completed(futures):
+                versions[futures[future]] = future.result()
+        
+        return versions
+    
     def add_blender(self, blender_path):
         """添加Blender路径
         
@@ -78,22 +382,24 @@ class BlenderManager:
             blender_path = os.path.normpath(blender_path)
             
             # 检查是否已存在
-            if blender_path in self.blender_paths:
-                self.logger.info(f"Blender路径已存在: {blender_path}")
+            path_key = _path_key(blender_path)
+            if path_key in self._paths_set:
+                self.logger.info("Blender路径已存在: %s", blender_path)
                 return False, "该Blender路径已存在"
             
             # 检查是否是有效的Blender目录
             blender_exe = os.path.join(blender_path, "blender.exe")
-            if not os.path.exists(blender_exe):
-                self.logger.warning(f"无效的Blender目录: {blender_path}")
+            if not os.path.isfile(blender_exe):
+                self.logger.warning("无效的Blender目录: %s", blender_path)
                 return False, "所选目录不是有效的Blender安装目录"
             
             # 添加到列表
             self.blender_paths.append(blender_path)
-            self.logger.info(f"添加Blender路径: {blender_path}")
+            self._paths_set.add(path_key)
+            self.logger.info("添加Blender路径: %s", blender_path)
             return True, "成功添加Blender路径"
         except Exception as e:
-            self.logger.error(f"添加Blender路径时出错: {str(e)}")
+            self.logger.error("添加Blender路径时出错: %s", e)
             return False, f"添加失败: {str(e)}"
     
     def remove_blender(self, index):
@@ -106,49 +412,111 @@ class BlenderManager:
             bool: 是否成功删除
         """
         try:
-            if 0 <= index < len(self.blender_paths):
-                path = self.blender_paths[index]
-                del self.blender_paths[index]
-                self.logger.info(f"删除Blender路径: {path}")
-                return True, "成功删除Blender路径"
-            else:
-                self.logger.warning(f"尝试删除无效的Blender索引: {index}")
+            path = self._get_path(index)
+            if path is None:
+                self.logger.warning("尝试删除无效的Blender索引: %s", index)
                 return False, "无效的Blender索引"
+            
+            self._remove_path(index)
+            self.logger.info("删除Blender路径: %s", path)
+            return True, "成功删除Blender路径"
         except Exception as e:
-            self.logger.error(f"删除Blender路径时出错: {str(e)}")
+            self.logger.error("删除Blender路径时出错: %s", e)
             return False, f"删除失败: {str(e)}"
     
-    def uninstall_blender(self, index):
+    def uninstall_blender(self, index, callback):
         """卸载Blender
         
+        目录在后台线程中删除，避免大目录删除时阻塞界面。
+        删除完成前列表项保留，删除成功后由调用方在主线程中调用remove_blender_path移除
+        
         Args:
             index: 要卸载的Blender索引
+            callback: 删除完成后的回调 callback(success, path, message)，在后台线程中调用
             
         Returns:
-            bool: 是否成功卸载
+            bool: 是否成功开始卸载
         """
         try:
-            if 0 <= index < len(self.blender_paths):
-                path = self.blender_paths[index]
-                
-                # 确认路径存在
-                if not os.path.exists(path):
-                    self.logger.warning(f"尝试卸载不存在的Blender目录: {path}")
-                    del self.blender_paths[index]
-                    return False, "Blender目录不存在"
-                
-                # 删除目录
-                shutil.rmtree(path)
-                del self.blender_paths[index]
-                self.logger.info(f"卸载Blender: {path}")
-                return True, "成功卸载Blender"
-            else:
-                self.logger.warning(f"尝试卸载无效的Blender索引: {index}")
+            path = self._get_path(index)
+            if path is None:
+                self.logger.warning("尝试卸载无效的Blender索引: %s", index)
                 return False, "无效的Blender索引"
+            
+            # 确认路径存在
+            if not os.path.exists(path):
+                self.logger.warning("尝试卸载不存在的Blender目录: %s", path)
+                self._remove_path(index)
+                return False, "Blender目录不存在"
+            
+            # 正在运行的Blender占用着目录中的文件，删除只会留下残缺的目录
+            if self.get_instances(index):
+                self.logger.warning("尝试卸载正在运行的Blender: %s", path)
+                return False, "该Blender正在运行，请先关闭后再卸载"
+            
+            path_key = _path_key(path)
+            if path_key in self._uninstalling:
+                return False, "该Blender正在卸载中"
+            
+            self._uninstalling.add(path_key)
+            threading.Thread(
+                target=self._remove_tree,
+                args=(path, callback),
+                daemon=True
+            ).start()
+            self.logger.info("开始卸载Blender: %s", path)
+            return True, "正在后台删除Blender目录"
         except Exception as e:
-            self.logger.error(f"卸载Blender时出错: {str(e)}")
+            self.logger.error("卸载Blender时出错: %s", e)
             return False, f"卸载失败: {str(e)}"
     
+    def _remove_tree(self, path, callback):
+        """在后台线程中删除Blender目录
+        
+        Args:
+            path: 要删除的目录
+            callback: 删除完成后的回调 callback(success, path, message)
+        """
+        import shutil
+        import stat
+        
+        def on_error(func, error_path, exc_info):
+            # Windows下只读文件无法直接删除，去掉只读属性后重试
+            if issubclass(exc_info[0], PermissionError):
+                os.chmod(error_path, stat.S_IWRITE)
+                func(error_path)
+            else:
+                raise exc_info[1]
+        
+        try:
+            shutil.rmtree(path, onerror=on_error)
+            self.logger.info("卸载Blender: %s", path)
+            success, message = True, "成功卸载Blender"
+        except Exception as e:
+            self.logger.error("删除Blender目录时出错: %s", e)
+            success, message = False, f"删除Blender目录时出错: {str(e)}"
+        finally:
+            self._uninstalling.discard(_path_key(path))
+        
+        callback(success, path, message)
+    
+    def remove_blender_path(self, path):
+        """按路径删除Blender路径
+        
+        Args:
+            path: Blender安装路径
+            
+        Returns:
+            bool: 列表中是否存在该路径
+        """
+        path_key = _path_key(path)
+        for index, blender_path in enumerate(self._blender_paths):
+            if _path_key(blender_path) == path_key:
+                self._remove_path(index)
+                self.logger.info("删除Blender路径: %s", blender_path)
+                return True
+        return False
+    
     def launch_blender(self, index, args=None, capture_output=True):
         """启动Blender
         
@@ -161,525 +529,393 @@ class BlenderManager:
             bool: 是否成功启动
         """
         try:
-            if 0 <= index < len(self.blender_paths):
-                path = self.blender_paths[index]
-                blender_exe = os.path.join(path, "blender.exe")
+            self._reap_finished()
+            
+            path = self._get_path(index)
+            if path is None:
+                self.logger.warning("尝试启动无效的Blender索引: %s", index)
+                return False, "无效的Blender索引"
+            
+            blender_exe = os.path.join(path, "blender.exe")
+            
+            if not os.path.isfile(blender_exe):
+                self.logger.warning("找不到blender.exe: %s", blender_exe)
+                return False, "找不到blender.exe"
+            
+            if _path_key(path) in self._uninstalling:
+                self.logger.warning("尝试启动正在卸载的Blender: %s", path)
+                return False, "该Blender正在卸载中"
+            
+            running = self._instances.get(path)
+            if running:
+                self.logger.info("该Blender已有%s个实例在运行，启动新的实例: %s", len(running), path)
+            
+            # 启动前通常已获取过版本，这里直接命中缓存
+            version = self.get_blender_version(path)
+            
+            import subprocess
+            
+            # 准备命令行参数
+            cmd = [blender_exe]
+            if args:
+                cmd.extend(args)
+            
+            # 启动进程
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("启动Blender: %s", ' '.join(cmd))
+            
+            # 输出捕获级别: full 全部记录, errors_only 只记录错误和警告, none 不捕获
+            capture_level = self.config.get('capture_level', 'full')
+            
+            # 使用不同方式启动Blender
+            if capture_output and capture_level == 'none':
+                # 丢弃全部输出，不创建读取线程
+                self.logger.info("启动Blender（丢弃输出）...")
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    creationflags=subprocess.CREATE_NO_WINDOW  # 不显示控制台窗口
+                )
+                # 存储运行实例
+                self._add_instance(BlenderInstance(path, version, process))
+                
+                self.logger.info("已创建进程，PID: %s", process.pid)
+            
+            elif capture_output:
+                # 捕获标准输出和标准错误
+                self.logger.info("启动Blender（捕获输出）...")
+                
+                # 在启动前确定日志文件路径，读取线程启动后即可直接写入
+                log_files = self._make_log_files()
                 
-                if not os.path.exists(blender_exe):
-                    self.logger.warning(f"找不到blender.exe: {blender_exe}")
-                    return False, "找不到blender.exe"
+                # 直接创建进程，而不是在线程中创建
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=1 << 16,  # 64KB块缓冲（二进制模式下行缓冲无效）
+                    universal_newlines=False,  # 使用二进制模式，我们会在_capture_output中处理编码
+                    creationflags=subprocess.CREATE_NO_WINDOW  # 不显示控制台窗口
+                )
                 
-                # 准备命令行参数
-                cmd = [blender_exe]
-                if args:
-                    cmd.extend(args)
+                # 存储运行实例
+                self._add_instance(BlenderInstance(path, version, process, log_files))
                 
-                # 启动进程
-                self.logger.info(f"启动Blender: {' '.join(cmd)}")
+                self.logger.info("已创建进程，PID: %s", process.pid)
                 
-                # 使用不同方式启动Blender
-                if capture_output:
-                    # 捕获标准输出和标准错误
-                    self.logger.info("启动Blender（捕获输出）...")
-                    
-                    # 直接创建进程，而不是在线程中创建
-                    process = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        bufsize=1,  # 行缓冲
-                        universal_newlines=False,  # 使用二进制模式，我们会在_capture_output中处理编码
-                        creationflags=subprocess.CREATE_NO_WINDOW  # 不显示控制台窗口
-                    )
-                    
-                    # 存储进程对象
-                    if not hasattr(self, '_processes'):
-                        self._processes = {}
-                    self._processes[index] = process
-                    
-                    self.logger.info(f"已创建进程，PID: {process.pid}")
-                    
-                    # 使用子线程读取输出
-                    thread = threading.Thread(
-                        target=self._capture_output,
-                        args=(process, index),
-                        daemon=True
-                    )
-                    thread.start()
-                    
-                    # 等待线程启动
-                    import time
-                    time.sleep(0.1)
-                    
-                else:
-                    # 不捕获输出，直接启动
-                    self.logger.info("启动Blender（不捕获输出）...")
-                    process = subprocess.Popen(
-                        cmd,
-                        creationflags=subprocess.CREATE_NO_WINDOW  # 不显示控制台窗口
-                    )
-                    # 存储进程对象
-                    if not hasattr(self, '_processes'):
-                        self._processes = {}
-                    self._processes[index] = process
-                    
-                    self.logger.info(f"已创建进程，PID: {process.pid}")
+                # 使用子线程读取输出
+                thread = threading.Thread(
+                    target=self._capture_output,
+                    args=(process, index, log_files, capture_level == 'errors_only'),
+                    daemon=True
+                )
+                thread.start()
                 
-                return True, "成功启动Blender"
             else:
-                self.logger.warning(f"尝试启动无效的Blender索引: {index}")
-                return False, "无效的Blender索引"
+                # 不捕获输出，直接启动
+                # 使用独立的进程组并脱离启动器控制台，启动器退出或收到Ctrl+C时Blender不受影响
+                self.logger.info("启动Blender（不捕获输出）...")
+                process = subprocess.Popen(
+                    cmd,
+                    creationflags=(subprocess.CREATE_NO_WINDOW
+                                   | subprocess.CREATE_NEW_PROCESS_GROUP
+                                   | subprocess.DETACHED_PROCESS)
+                )
+                # 存储运行实例
+                self._add_instance(BlenderInstance(path, version, process, new_process_group=True))
+                
+                self.logger.info("已创建进程，PID: %s", process.pid)
+            
+            return True, "成功启动Blender"
         except Exception as e:
-            self.logger.error(f"启动Blender时出错: {str(e)}")
+            self.logger.error("启动Blender时出错: %s", e)
             return False, f"启动失败: {str(e)}"
     
-    def get_running_process(self, index):
-        """获取正在运行的Blender进程
+    def _add_instance(self, instance):
+        """记录新启动的Blender实例
         
         Args:
-            index: Blender索引
-            
+            instance: BlenderInstance对象
+        """
+        self._instances.setdefault(instance.path, []).append(instance)
+    
+    def _make_log_files(self):
+        """生成本次启动的Blender日志文件路径
+        
+        同一秒内多次启动时在时间戳后加序号，并以独占方式预先创建文件占用文件名，
+        多个实例不会写入同一个日志文件
+        
         Returns:
-            subprocess.Popen: 进程对象，如果不存在则返回None
+            tuple: (Blender日志文件路径, 组合日志文件路径)
         """
-        if hasattr(self, '_processes') and index in self._processes:
-            process = self._processes[index]
-            # 检查进程是否仍在运行
-            if process.poll() is None:
-                return process
-            else:
-                # 进程已结束，清理
-                del self._processes[index]
-        return None
+        import datetime
+        
+        # 确保日志目录存在
+        log_dir = "logs"
+        if hasattr(self.logger, 'parent') and self.logger.parent:
+            for handler in self.logger.parent.handlers:
+                if isinstance(handler, logging.FileHandler):
+                    log_dir = os.path.dirname(handler.baseFilename)
+                    break
+        
+        os.makedirs(log_dir, exist_ok=True)
+        
+        # 创建时间戳
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H%M%S")
+        
+        serial = 1
+        while True:
+            suffix = f"_{serial}" if serial > 1 else ""
+            log_files = (
+                os.path.join(log_dir, f"blender-{timestamp}{suffix}.log"),
+                os.path.join(log_dir, f"combined-{timestamp}{suffix}.log")
+            )
+            created = []
+            try:
+                for log_file in log_files:
+                    open(log_file, 'x').close()
+                    created.append(log_file)
+                return log_files
+            except FileExistsError:
+                for log_file in created:
+                    os.remove(log_file)
+                serial += 1
     
-    def _run_with_output_capture(self, cmd, index):
-        """在子线程中运行进程并捕获输出
+    def stop_blender(self, index, timeout=2):
+        """停止该Blender安装正在运行的所有实例
+        
+        独立进程组中的实例先发送CTRL_BREAK_EVENT请求退出，其他实例直接terminate，
+        超时后强制结束进程
         
         Args:
-            cmd: 命令行参数列表
             index: Blender索引
+            timeout: 等待每个进程退出的秒数
+            
+        Returns:
+            bool: 是否成功停止
         """
-        import threading
+        instances = self.get_instances(index)
+        if not instances:
+            return False, "Blender未在运行"
+        
+        import signal
+        import subprocess
         
         try:
-            # 创建日志记录器
-            blender_logger = None
-            combined_logger = None
-            
-            # 获取BlenderManager的日志处理器
-            if hasattr(self.logger, 'parent'):
-                logger_parent = self.logger.parent
-                if hasattr(logger_parent, 'handlers'):
-                    # 创建特定的日志记录器
-                    import logging
-                    
-                    # Blender专用日志记录器
-                    blender_logger = logging.getLogger(f"Blender_{index}")
-                    blender_logger.setLevel(logging.DEBUG)
-                    
-                    # 清除已有的处理器
-                    if blender_logger.hasHandlers():
-                        for handler in blender_logger.handlers[:]:
-                            blender_logger.removeHandler(handler)
-                    
-                    # 添加处理器
-                    for handler in logger_parent.handlers:
-                        if isinstance(handler, logging.FileHandler):
-                            # 为Blender创建新的日志文件
-                            log_dir = os.path.dirname(handler.baseFilename)
-                            if not os.path.exists(log_dir):
-                                os.makedirs(log_dir)
-                            
-                            # 创建时间戳
-                            import datetime
-                            timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H%M%S")
-                            
-                            # 创建Blender专用日志文件
-                            blender_log_file = os.path.join(log_dir, f"blender-{timestamp}.log")
-                            blender_handler = logging.FileHandler(blender_log_file, encoding='utf-8')
-                            blender_formatter = logging.Formatter(
-                                '%(asctime)s [Blender] [%(levelname)s] %(message)s',
-                                datefmt='%Y-%m-%d %H:%M:%S'
-                            )
-                            blender_handler.setFormatter(blender_formatter)
-                            blender_logger.addHandler(blender_handler)
-                            
-                            # 创建组合日志文件
-                            combined_log_file = os.path.join(log_dir, f"combined-{timestamp}.log")
-                            combined_logger = logging.getLogger(f"Combined_{index}")
-                            combined_logger.setLevel(logging.DEBUG)
-                            
-                            # 清除已有的处理器
-                            if combined_logger.hasHandlers():
-                                for handler in combined_logger.handlers[:]:
-                                    combined_logger.removeHandler(handler)
-                            
-                            # 添加组合日志处理器
-                            combined_handler = logging.FileHandler(combined_log_file, encoding='utf-8')
-                            combined_formatter = logging.Formatter(
-                                '%(asctime)s [%(name)s] [%(levelname)s] %(message)s',
-                                datefmt='%Y-%m-%d %H:%M:%S'
-                            )
-                            combined_handler.setFormatter(combined_formatter)
-                            combined_logger.addHandler(combined_handler)
-                            
-                            break
-            
-            # 启动进程，捕获输出
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                bufsize=1,
-                universal_newlines=True,
-                encoding='utf-8'  # 明确指定UTF-8编码
-            )
-            
-            # 存储进程对象
-            if not hasattr(self, '_processes'):
-                self._processes = {}
-            self._processes[index] = process
-            
-            # 读取输出
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    # 记录到Blender日志
-                    if blender_logger:
-                        if "error" in line.lower():
-                            blender_logger.error(line)
-                            if combined_logger:
-                                combined_logger.error(f"[Blender] {line}")
-                        elif "warning" in line.lower():
-                            blender_logger.warning(line)
-                            if combined_logger:
-                                combined_logger.warning(f"[Blender] {line}")
-                        else:
-                            blender_logger.info(line)
-                            if combined_logger:
-                                combined_logger.info(f"[Blender] {line}")
+            for instance in instances:
+                process = instance.process
+                try:
+                    if instance.new_process_group:
+                        os.kill(process.pid, signal.CTRL_BREAK_EVENT)
                     else:
-                        # 如果没有特定的日志记录器，使用常规记录器
-                        self.logger.info(f"[Blender输出] {line}")
+                        # 不在独立进程组中的进程收到的CTRL_BREAK_EVENT会发给整个控制台进程组，
+                        # 包括启动器本身
+                        process.terminate()
+                    process.wait(timeout=timeout)
+                except (AttributeError, OSError, subprocess.TimeoutExpired):
+                    # 非Windows平台、进程没有控制台或未响应时强制结束
+                    process.kill()
+                    process.wait(timeout=timeout)
+                self.logger.info("已停止Blender (索引: %s, PID: %s)", index, process.pid)
             
-            # 等待进程结束
-            process.wait()
+            self._instances.pop(instances[0].path, None)
+            return True, "已停止Blender"
+        except Exception as e:
+            self.logger.error("停止Blender时出错: %s", e)
+            return False, f"停止失败: {str(e)}"
+    
+    def get_instances(self, index):
+        """获取该Blender安装正在运行的所有实例
+        
+        Args:
+            index: Blender索引
             
-            # 清理进程引用
-            if hasattr(self, '_processes') and index in self._processes:
-                del self._processes[index]
+        Returns:
+            list: 按启动顺序排列的BlenderInstance列表，未在运行时为空列表
+        """
+        path = self._get_path(index)
+        if path is None:
+            return []
+        
+        # 先清理已结束的进程，剩下的都仍在运行
+        self._reap_finished()
+        return list(self._instances.get(path, ()))
+    
+    def get_instance(self, index):
+        """获取最近一次启动且仍在运行的Blender实例
+        
+        Args:
+            index: Blender索引
             
-        except Exception as e:
-            self.logger.error(f"捕获Blender输出时出错: {str(e)}")
+        Returns:
+            BlenderInstance: 运行实例，如果未在运行则返回None
+        """
+        instances = self.get_instances(index)
+        return instances[-1] if instances else None
+    
+    def get_running_process(self, index):
+        """获取正在运行的Blender进程
+        
+        Args:
+            index: Blender索引
             
-            # 确保进程终止
-            if 'process' in locals():
-                try:
-                    process.terminate()
-                except:
-                    pass
-                
-                # 清理进程引用
-                if hasattr(self, '_processes') and index in self._processes:
-                    del self._processes[index]
+        Returns:
+            subprocess.Popen: 进程对象，如果不存在则返回None
+        """
+        instance = self.get_instance(index)
+        return instance.process if instance else None
     
-    def _capture_output(self, process, index):
+    def _reap_finished(self):
+        """清理已结束的进程记录"""
+        for path, instances in list(self._instances.items()):
+            running = [instance for instance in instances if instance.is_running()]
+            if running:
+                self._instances[path] = running
+            else:
+                self._instances.pop(path, None)
+    
+    def _capture_output(self, process, index, log_files, errors_only=False):
         """在子线程中捕获进程输出
         
         Args:
             process: 进程对象
             index: Blender索引
+            log_files: (Blender日志文件路径, 组合日志文件路径)
+            errors_only: 是否只记录错误和警告，普通输出直接丢弃
         """
+        blender_logger = None
+        combined_logger = None
+        
         try:
-            # 创建日志记录器
-            blender_logger = None
-            combined_logger = None
-            
-            # 创建特定的日志记录器
-            import logging
-            import datetime
-            
-            # 确保日志目录存在
-            log_dir = "logs"
-            if hasattr(self.logger, 'parent') and self.logger.parent:
-                for handler in self.logger.parent.handlers:
-                    if isinstance(handler, logging.FileHandler):
-                        log_dir = os.path.dirname(handler.baseFilename)
-                        break
-            
-            if not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-            
-            # 创建时间戳
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H%M%S")
-            
-            # 创建Blender专用日志文件
-            blender_log_file = os.path.join(log_dir, f"blender-{timestamp}.log")
-            blender_logger = logging.getLogger(f"Blender_{index}")
-            blender_logger.setLevel(logging.DEBUG)
-            
-            # 清除已有的处理器
-            if blender_logger.hasHandlers():
-                for handler in blender_logger.handlers[:]:
-                    blender_logger.removeHandler(handler)
+            import subprocess
+            
+            blender_log_file, combined_log_file = log_files
+            
+            # 创建Blender专用日志记录器
+            # 每次启动单独创建、不在logging中注册，同一安装的多个实例互不干扰，
+            # 进程结束后即可被回收，不会随启动次数累积
+            blender_logger = logging.Logger(f"Blender_{index}", logging.DEBUG)
             
             # 添加文件处理器
-            blender_handler = logging.FileHandler(blender_log_file, encoding='utf-8', mode='w')
-            blender_formatter = logging.Formatter(
-                '%(asctime)s [Blender] [%(levelname)s] %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            blender_handler.setFormatter(blender_formatter)
+            blender_handler = logging.FileHandler(blender_log_file, encoding='utf-8', mode='w', delay=True)
+            blender_handler.setFormatter(self._blender_formatter)
             blender_logger.addHandler(blender_handler)
             
-            # 添加控制台处理器
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(blender_formatter)
-            blender_logger.addHandler(console_handler)
-            
-            # 创建组合日志文件
-            combined_log_file = os.path.join(log_dir, f"combined-{timestamp}.log")
-            combined_logger = logging.getLogger(f"Combined_{index}")
-            combined_logger.setLevel(logging.DEBUG)
+            # 添加控制台处理器（所有Blender日志记录器共用同一个）
+            blender_logger.addHandler(self._console_handler)
             
-            # 清除已有的处理器
-            if combined_logger.hasHandlers():
-                for handler in combined_logger.handlers[:]:
-                    combined_logger.removeHandler(handler)
+            # 创建组合日志记录器
+            combined_logger = logging.Logger(f"Combined_{index}", logging.DEBUG)
             
             # 添加组合日志处理器
-            combined_handler = logging.FileHandler(combined_log_file, encoding='utf-8', mode='w')
-            combined_formatter = logging.Formatter(
-                '%(asctime)s [%(name)s] [%(levelname)s] %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            combined_handler.setFormatter(combined_formatter)
+            combined_handler = logging.FileHandler(combined_log_file, encoding='utf-8', mode='w', delay=True)
+            combined_handler.setFormatter(self._combined_formatter)
             combined_logger.addHandler(combined_handler)
             
-            self.logger.info(f"已创建Blender日志文件: {blender_log_file}")
-            self.logger.info(f"已创建组合日志文件: {combined_log_file}")
+            self.logger.info("已创建Blender日志文件: %s", blender_log_file)
+            self.logger.info("已创建组合日志文件: %s", combined_log_file)
             
             # 记录开始读取日志
-            self.logger.info(f"开始捕获Blender输出 (索引: {index}, PID: {process.pid})")
-            blender_logger.info(f"开始捕获Blender输出 (PID: {process.pid})")
+            self.logger.info("开始捕获Blender输出 (索引: %s, PID: %s)", index, process.pid)
+            blender_logger.info("开始捕获Blender输出 (PID: %s)", process.pid)
             
-            # 尝试直接读取输出流，使用多种编码
-            encodings = ['utf-8', 'gbk', 'latin-1', 'cp936']
             lines_read = 0
             
-            # 尝试不同的读取方法
-            try:
-                self.logger.info(f"尝试使用方法1读取Blender输出流")
-                
-                import io
-                import time
-                
-                # 为了更可靠地读取输出，使用一个缓冲区
-                buffer = b''
+            def log_line(line):
+                """按级别记录一行输出，返回实际记录的行数"""
+                level = _line_level(line, errors_only)
+                if level is None:
+                    return 0
+                blender_logger.log(level, line)
+                if combined_logger:
+                    combined_logger.log(level, "[Blender] %s", line)
+                return 1
+            
+            # 使用同一个增量解码器处理整个输出流，
+            # 被切分在两次读取之间的多字节字符也能正确解码
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            text_buffer = ''
+            
+            # read1会阻塞到有数据可读，管道EOF即表示进程已关闭输出
+            read_chunk = process.stdout.read1
+            while True:
+                chunk = read_chunk(65536)
+                if not chunk:  # EOF
+                    break
                 
-                # 直接读取原始字节流
-                if hasattr(process.stdout, 'buffer'):
-                    stdout_buffer = process.stdout.buffer
-                else:
-                    # 如果没有buffer属性，可能已经是二进制模式
-                    stdout_buffer = process.stdout
+                text_buffer += decoder.decode(chunk)
                 
-                while process.poll() is None:  # 只要进程在运行
-                    # 读取一部分数据
-                    try:
-                        chunk = stdout_buffer.read(1024)
-                        if not chunk:  # 如果没有数据，等待一下再继续
-                            time.sleep(0.1)
-                            continue
-                            
-                        buffer += chunk
-                        
-                        # 检查是否有完整的行
-                        while b'\n' in buffer:
-                            # 获取一行数据
-                            line_bytes, buffer = buffer.split(b'\n', 1)
-                            
-                            # 尝试不同编码解码
-                            decoded_line = None
-                            last_error = None
-                            
-                            for encoding in encodings:
-                                try:
-                                    decoded_line = line_bytes.decode(encoding).strip()
-                                    self.logger.debug(f"成功使用{encoding}解码")
-                                    break
-                                except UnicodeDecodeError as e:
-                                    last_error = e
-                                    continue
-                            
-                            # 如果所有编码都失败，使用latin-1作为后备
-                            if decoded_line is None:
-                                self.logger.warning(f"所有编码解析失败，使用latin-1替代: {str(last_error)}")
-                                decoded_line = line_bytes.decode('latin-1', errors='replace').strip()
-                            
-                            if decoded_line:
-                                lines_read += 1
-                                # 记录到Blender日志
-                                if "error" in decoded_line.lower():
-                                    blender_logger.error(decoded_line)
-                                    if combined_logger:
-                                        combined_logger.error(f"[Blender] {decoded_line}")
-                                elif "warning" in decoded_line.lower():
-                                    blender_logger.warning(decoded_line)
-                                    if combined_logger:
-                                        combined_logger.warning(f"[Blender] {decoded_line}")
-                                else:
-                                    blender_logger.info(decoded_line)
-                                    if combined_logger:
-                                        combined_logger.info(f"[Blender] {decoded_line}")
-                    except Exception as read_error:
-                        self.logger.warning(f"读取输出时出错: {str(read_error)}")
-                        time.sleep(0.1)
+                # 检查是否有完整的行
+                if '\n' not in text_buffer:
+                    continue
+                *lines, text_buffer = text_buffer.split('\n')
                 
-                # 处理剩余的缓冲区
-                if buffer:
-                    decoded_line = None
-                    for encoding in encodings:
-                        try:
-                            decoded_line = buffer.decode(encoding).strip()
-                            break
-                        except UnicodeDecodeError:
-                            continue
-                    
-                    if decoded_line is None:
-                        decoded_line = buffer.decode('latin-1', errors='replace').strip()
-                    
+                for line in lines:
+                    decoded_line = line.strip()
                     if decoded_line:
-                        lines_read += 1
-                        blender_logger.info(decoded_line)
-                        if combined_logger:
-                            combined_logger.info(f"[Blender] {decoded_line}")
-                
-            except Exception as e:
-                self.logger.error(f"使用方法1读取Blender输出时出错: {str(e)}")
-                blender_logger.error(f"使用方法1读取Blender输出时出错: {str(e)}")
-                
-                # 方法2：尝试使用readlines方法
-                self.logger.info("切换到备用方法2读取Blender输出")
-                blender_logger.info("切换到备用方法2读取Blender输出")
-                
-                try:
-                    # 确保stdout已经初始化
-                    if process.stdout and not process.stdout.closed:
-                        for line in iter(process.stdout.readline, ''):
-                            if not line:
-                                break
-                                
-                            if isinstance(line, bytes):
-                                # 尝试不同编码
-                                decoded_line = None
-                                for encoding in encodings:
-                                    try:
-                                        decoded_line = line.decode(encoding).strip()
-                                        break
-                                    except UnicodeDecodeError:
-                                        continue
-                                
-                                if decoded_line is None:
-                                    # 如果所有编码都失败，使用latin-1作为后备
-                                    decoded_line = line.decode('latin-1', errors='replace').strip()
-                            else:
-                                decoded_line = line.strip()
-                                
-                            if decoded_line:
-                                lines_read += 1
-                                # 记录到Blender日志
-                                if "error" in decoded_line.lower():
-                                    blender_logger.error(decoded_line)
-                                    if combined_logger:
-                                        combined_logger.error(f"[Blender] {decoded_line}")
-                                elif "warning" in decoded_line.lower():
-                                    blender_logger.warning(decoded_line)
-                                    if combined_logger:
-                                        combined_logger.warning(f"[Blender] {decoded_line}")
-                                else:
-                                    blender_logger.info(decoded_line)
-                                    if combined_logger:
-                                        combined_logger.info(f"[Blender] {decoded_line}")
-                                        
-                except Exception as e2:
-                    self.logger.error(f"使用方法2读取Blender输出时出错: {str(e2)}")
-                    blender_logger.error(f"使用方法2读取Blender输出时出错: {str(e2)}")
-                    
-                    # 方法3：最后的尝试，使用communicate方法
-                    self.logger.info("切换到最后方法3读取Blender输出")
-                    blender_logger.info("切换到最后方法3读取Blender输出")
-                    
-                    try:
-                        # 如果进程还在运行
-                        if process.poll() is None:
-                            output, error = process.communicate()
-                            
-                            if output:
-                                # 尝试解码
-                                decoded_output = None
-                                for encoding in encodings:
-                                    try:
-                                        if isinstance(output, bytes):
-                                            decoded_output = output.decode(encoding)
-                                        else:
-                                            decoded_output = output
-                                        break
-                                    except UnicodeDecodeError:
-                                        continue
-                                
-                                if decoded_output is None:
-                                    # 如果所有编码都失败，使用latin-1作为后备
-                                    decoded_output = output.decode('latin-1', errors='replace') if isinstance(output, bytes) else output
-                                
-                                # 记录输出
-                                for line in decoded_output.splitlines():
-                                    line = line.strip()
-                                    if line:
-                                        lines_read += 1
-                                        if "error" in line.lower():
-                                            blender_logger.error(line)
-                                            if combined_logger:
-                                                combined_logger.error(f"[Blender] {line}")
-                                        elif "warning" in line.lower():
-                                            blender_logger.warning(line)
-                                            if combined_logger:
-                                                combined_logger.warning(f"[Blender] {line}")
-                                        else:
-                                            blender_logger.info(line)
-                                            if combined_logger:
-                                                combined_logger.info(f"[Blender] {line}")
-                    except Exception as e3:
-                        self.logger.error(f"使用方法3读取Blender输出时出错: {str(e3)}")
-                        blender_logger.error(f"使用方法3读取Blender输出时出错: {str(e3)}")
-            
-            # 等待进程结束
-            process.wait()
+                        # 记录到Blender日志
+                        lines_read += log_line(decoded_line)
             
-            # 记录进程退出信息
-            exit_message = f"Blender进程已退出 (索引: {index}, 读取了{lines_read}行日志)"
-            self.logger.info(exit_message)
-            blender_logger.info(exit_message)
-            if combined_logger:
-                combined_logger.info(exit_message)
+            # 处理剩余的缓冲区
+            text_buffer += decoder.decode(b'', final=True)
+            decoded_line = text_buffer.strip()
+            if decoded_line:
+                lines_read += log_line(decoded_line)
+            
+            # 释放管道
+            if process.stdout:
+                process.stdout.close()
             
-            # 确保日志被写入文件
-            for handler in blender_logger.handlers:
-                handler.flush()
+            # 等待进程结束。输出已到EOF，进程通常随即退出；
+            # 超时说明Blender关闭了输出但仍在运行，不再阻塞读取线程，交由_reap_finished回收
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.logger.warning("Blender输出已结束但进程仍在运行 (索引: %s, PID: %s)", index, process.pid)
+                return
+            
+            # 记录进程退出信息
+            exit_message = "Blender进程已退出 (索引: %s, 记录了%s行日志)"
+            self.logger.info(exit_message, index, lines_read)
+            blender_logger.info(exit_message, index, lines_read)
             if combined_logger:
-                for handler in combined_logger.handlers:
-                    handler.flush()
+                combined_logger.info(exit_message, index, lines_read)
             
             # 清理进程引用
-            if hasattr(self, '_processes') and index in self._processes:
-                del self._processes[index]
+            self._reap_finished()
             
         except Exception as e:
-            self.logger.error(f"捕获Blender输出时出错: {str(e)}")
+            self.logger.error("捕获Blender输出时出错: %s", e)
+            
+            # 无法继续读取输出时终止进程，避免管道写满后Blender被阻塞
+            try:
+                process.terminate()
+            except Exception:
+                pass
             
             # 清理进程引用
-            if hasattr(self, '_processes') and index in self._processes:
-                del self._processes[index]
+            self._reap_finished()
+        
+        finally:
+            # 进程结束后关闭日志文件，避免文件句柄随启动次数累积
+            if blender_logger:
+                self._close_log_handlers(blender_logger)
+            if combined_logger:
+                self._close_log_handlers(combined_logger)
+    
+    def _close_log_handlers(self, logger):
+        """关闭并移除日志记录器上的处理器
+        
+        共用的控制台处理器只移除不关闭
+        
+        Args:
+            logger: 日志记录器
+        """
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            if handler is not self._console_handler:
+                handler.close()
     
     def auto_detect_blender(self, search_dir=None):
         """自动检测Blender安装
@@ -693,29 +929,52 @@ class BlenderManager:
         try:
             search_dir = search_dir or self.config.get('auto_detect_path')
             if not search_dir or not os.path.exists(search_dir):
-                self.logger.warning(f"无效的自动检测目录: {search_dir}")
+                self.logger.warning("无效的自动检测目录: %s", search_dir)
                 return []
             
-            self.logger.info(f"开始自动检测Blender: {search_dir}")
+            # 目录修改时间未变化时直接使用上次的扫描结果
+            # (Windows下直接子目录的创建/删除会更新目录的mtime，新安装仍会触发重新扫描)
+            dir_mtime = os.stat(search_dir).st_mtime_ns
+            cache = self.config.get('autodetect_cache', {})
+            if cache.get('dir') == search_dir and cache.get('mtime') == dir_mtime:
+                self.logger.info("自动检测目录未变化，使用缓存结果: %s", search_dir)
+                # 删除子目录中的文件不会更新搜索目录的mtime，缓存的结果需确认blender.exe仍然存在
+                cached_paths = cache.get('paths', [])
+                found_paths = [subdir for subdir in cached_paths
+                               if os.path.isfile(os.path.join(subdir, "blender.exe"))]
+                if len(found_paths) != len(cached_paths):
+                    cache['paths'] = found_paths
+            else:
+                self.logger.info("开始自动检测Blender: %s", search_dir)
+                
+                # 检查每个子目录是否为Blender安装目录
+                found_paths = _scan_blender_dirs(search_dir)
+                
+                self.config['autodetect_cache'] = {
+                    'dir': search_dir,
+                    'mtime': dir_mtime,
+                    'paths': found_paths
+                }
             
-            # 查找目录下的所有子目录
+            # 如果是Blender目录且不在列表中，则记录下来，稍后一次性添加
             added_paths = []
-            subdirs = [os.path.join(search_dir, d) for d in os.listdir(search_dir)
-                      if os.path.isdir(os.path.join(search_dir, d))]
-            
-            # 检查每个子目录是否为Blender安装目录
-            for subdir in subdirs:
-                blender_exe = os.path.join(subdir, "blender.exe")
-                if os.path.exists(blender_exe):
-                    # 如果是Blender目录且不在列表中，则添加
-                    if subdir not in self.blender_paths:
-                        self.blender_paths.append(subdir)
-                        added_paths.append(subdir)
-                        self.logger.info(f"自动检测添加Blender路径: {subdir}")
+            append = added_paths.append
+            known_paths = self._paths_set
+            for subdir in found_paths:
+                path_key = _path_key(subdir)
+                if path_key not in known_paths:
+                    known_paths.add(path_key)
+                    append(subdir)
+                    self.logger.info("自动检测添加Blender路径: %s", subdir)
+            
+            # 一次性添加并只同步一次配置
+            if added_paths:
+                self.blender_paths.extend(added_paths)
+                self.update_config()
             
             return added_paths
         except Exception as e:
-            self.logger.error(f"自动检测Blender时出错: {str(e)}")
+            self.logger.error("自动检测Blender时出错: %s", e)
             return []
     
     def get_blender_info(self, index):
@@ -728,19 +987,31 @@ class BlenderManager:
             dict: Blender信息
         """
         try:
-            if 0 <= index < len(self.blender_paths):
-                path = self.blender_paths[index]
-                version = self.get_blender_version(path)
-                return {
-                    'path': path,
-                    'version': version,
-                    'name': os.path.basename(path),
-                    'exists': os.path.exists(path)
-                }
-            else:
+            path = self._get_path(index)
+            if path is None:
                 return None
+            
+            name = os.path.basename(path)
+            
+            # 一次stat同时用于判断是否存在和查询版本缓存，
+            # 只有blender.exe不存在时才需要再检查目录本身
+            try:
+                exe_stat = os.stat(os.path.join(path, "blender.exe"))
+            except OSError:
+                version = name
+                exists = os.path.exists(path)
+            else:
+                version = self.get_blender_version(path, exe_stat)
+                exists = True
+            
+            return {
+                'path': path,
+                'version': version,
+                'name': name,
+                'exists': exists
+            }
         except Exception as e:
-            self.logger.error(f"获取Blender信息时出错: {str(e)}")
+            self.logger.error("获取Blender信息时出错: %s", e)
             return None
     
     def update_config(self):
@@ -12,17 +12,198 @@
 import os
 import sys
 import re
+import html
 import json
+import mmap
 import time
+import hashlib
 import shutil
-import zipfile
 import logging
+import functools
 import requests
 import threading
-from queue import Queue
-from urllib.parse import urljoin, urlparse
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, QMutex
-from bs4 import BeautifulSoup
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PyQt6.QtCore import QObject, pyqtSignal, QThread
+
+from src.utils import read_json_file
+
+
+@functools.lru_cache(maxsize=4096)
+def _version_key(version):
+    """版本号排序键，"3.6.1" -> (3, 6, 1)，非数字部分按0处理
+    
+    同一个版本号会在多次刷新和多处排序中重复出现，结果缓存后只解析一次
+    """
+    return tuple(int(n) if n.isdigit() else 0 for n in version.split('.'))
+
+
+# 从镜像获取最新的几个版本目录，以及为此最多检查的候选目录数
+MIRROR_VERSION_DIRS = 5
+MIRROR_CANDIDATE_DIRS = 8
+
+# 镜像版本列表缓存的有效期（秒），发布信息很少变化，期间内不再抓取镜像
+MIRROR_CACHE_TTL = 6 * 60 * 60
+
+# 下载页面中未找到Windows下载链接的结果缓存多久（秒），之后重新获取
+URL_MISS_CACHE_TTL = 60
+
+# 所有请求使用的浏览器标识，部分镜像会拒绝默认的python-requests标识
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# 下载时每次从连接读取的字节数，同时也是进度信号的发送粒度
+DOWNLOAD_READ_SIZE = 1 << 20
+
+# 解压时每次复制的字节数，比默认的64KB缓冲区少很多次读写调用
+EXTRACT_BUFFER_SIZE = 1 << 20
+
+# 并行解压的最大线程数，解压缩和写盘在线程间交错进行
+EXTRACT_WORKERS = min(8, os.cpu_count() or 4)
+
+# 小于该大小的文件不分块，多个连接的握手开销大于并行下载带来的收益
+CHUNK_MIN_SIZE = 16 << 20
+
+# 支持pwrite的平台（Linux/macOS）各块共用一个文件描述符按偏移写入；Windows回退为各自打开并seek
+_HAS_PWRITE = hasattr(os, 'pwrite')
+
+# 目录列表页面（Apache/Nginx autoindex）中的链接
+_HREF_RE = re.compile(r'<a\s[^>]*?href="([^"]*)"', re.IGNORECASE)
+
+# 目录列表中的一项：链接及其后直到下一个链接/表格行/pre结束的文本（包含大小列）
+_INDEX_ENTRY_RE = re.compile(
+    r'<a\s[^>]*?href="([^"]*)"[^>]*>.*?</a>(.*?)(?=<a\s|</tr>|</pre>|$)',
+    re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# 大小列：Apache为"412M"，表格样式为"265.2 MB"，Nginx为字节数
+_INDEX_SIZE_RE = re.compile(
+    r'(?:^|\s)(\d+(?:\.\d+)?)\s?([KMGT])(?:i?B)?(?=\s|$)|(?:^|\s)(\d+)\s*$',
+    re.IGNORECASE
+)
+_SIZE_UNITS = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+
+# 格式化文件大小时使用的单位
+_SIZE_UNIT_NAMES = ('B', 'KB', 'MB', 'GB')
+
+# 从链接和文本中提取版本号，在逐个链接的循环中使用，预先编译
+_RELEASE_DIR_RE = re.compile(r'Blender(\d+\.\d+)')
+_RELEASE_FILE_RE = re.compile(r'blender-(\d+\.\d+\.\d+)-')
+_MIRROR_DIR_RE = re.compile(r'blender-(\d+\.\d+)')
+_MIRROR_FILE_RE = re.compile(r'blender-(\d+\.\d+\.\d+)-windows-x64\.zip')
+_OFFICIAL_VERSION_RE = re.compile(r'Blender (\d+\.\d+\.\d+)')
+
+
+def _iter_hrefs(html_text):
+    """提取目录列表页面中所有链接的href
+    
+    目录列表页面结构简单，直接用正则提取，无需构建完整的DOM
+    
+    Args:
+        html_text: 页面HTML文本
+        
+    Yields:
+        str: 链接地址
+    """
+    for match in _HREF_RE.finditer(html_text):
+        href = match.group(1)
+        if '&' in href:
+            href = html.unescape(href)
+        yield href
+
+
+def _parse_index_size(text):
+    """解析目录列表中链接后面的文件大小
+    
+    Args:
+        text: 链接后面的文本
+        
+    Returns:
+        int: 字节数（带单位的大小为近似值），没有大小列时返回None
+    """
+    match = _INDEX_SIZE_RE.search(_TAG_RE.sub(' ', text).strip())
+    if not match:
+        return None
+    number, unit, plain = match.groups()
+    if plain is not None:
+        return int(plain)
+    return int(float(number) * _SIZE_UNITS[unit.upper()])
+
+
+def _iter_index_entries(html_text):
+    """提取目录列表页面中的链接及其文件大小
+    
+    Args:
+        html_text: 页面HTML文本
+        
+    Yields:
+        tuple: (链接地址, 字节数或None)
+    """
+    for match in _INDEX_ENTRY_RE.finditer(html_text):
+        href = match.group(1)
+        if '&' in href:
+            href = html.unescape(href)
+        yield href, _parse_index_size(match.group(2))
+
+
+def _file_sha256(file_path):
+    """计算文件的SHA-256
+    
+    通过内存映射把整个文件作为一个缓冲区交给hashlib，
+    由OpenSSL整块计算（可用时使用SHA硬件指令），不经过Python层的分块读取
+    
+    Args:
+        file_path: 文件路径
+        
+    Returns:
+        str: 十六进制摘要
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        # 空文件无法映射
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+    return digest.hexdigest()
+
+
+def _member_path(info, target_root):
+    """计算ZIP成员解压后的路径
+    
+    Args:
+        info: 成员的ZipInfo
+        target_root: 解压目标目录的绝对路径
+        
+    Returns:
+        str: 成员在目标目录中的路径
+    """
+    dest_path = os.path.normpath(os.path.join(target_root, info.filename))
+    # 与extractall一样，不允许成员写到目标目录之外
+    if os.path.commonpath([target_root, dest_path]) != target_root:
+        raise ValueError(f"ZIP成员路径不安全: {info.filename}")
+    return dest_path
+
+
+def _extract_members(zip_path, members):
+    """在当前线程中解压一组文件成员，目录需已创建
+    
+    ZipFile对象不能在线程间共享，每个线程各自打开一次
+    
+    Args:
+        zip_path: ZIP文件路径
+        members: (ZipInfo, 目标路径)列表
+    """
+    import zipfile
+    
+    # 使用大缓冲区打开，成员数据按1MB读取，而不是大量小块read调用
+    with open(zip_path, 'rb', buffering=EXTRACT_BUFFER_SIZE) as f, zipfile.ZipFile(f, 'r') as zip_ref:
+        for info, dest_path in members:
+            with zip_ref.open(info) as source, open(dest_path, 'wb') as target:
+                shutil.copyfileobj(source, target, EXTRACT_BUFFER_SIZE)
 
 
 class DownloadWorker(QThread):
@@ -33,25 +214,33 @@ class DownloadWorker(QThread):
     finished_signal = pyqtSignal(int, str)  # 完成信号(线程ID, 文件名)
     error_signal = pyqtSignal(int, str, str)  # 错误信号(线程ID, 文件名, 错误信息)
     
-    def __init__(self, thread_id, url, save_path, headers=None, proxies=None):
+    def __init__(self, thread_id, url, save_path, headers=None, proxies=None, session=None):
         super().__init__()
         self.thread_id = thread_id
         self.url = url
         self.save_path = save_path
         self.headers = headers or {}
         self.proxies = proxies
-        self.is_canceled = False
+        self.session = session or requests.Session()
+        self._cancel_event = threading.Event()
+        self._response = None
+    
+    @property
+    def is_canceled(self):
+        """是否已取消"""
+        return self._cancel_event.is_set()
         
     def run(self):
         """线程执行函数"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.url, 
                 headers=self.headers,
                 proxies=self.proxies,
                 stream=True,
                 timeout=30
             )
+            self._response = response
             response.raise_for_status()
             
             # 获取文件大小
@@ -61,36 +250,54 @@ class DownloadWorker(QThread):
             # 创建临时文件
             temp_path = f"{self.save_path}.part"
             
+            # 直接从底层连接按1MB读取，减少Python循环次数和跨线程信号数量
+            raw = response.raw
+            raw.decode_content = True
+            file_name = os.path.basename(self.save_path)
+            canceled = self._cancel_event.is_set
+            
             with open(temp_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self.is_canceled:
+                while not canceled():
+                    chunk = raw.read(DOWNLOAD_READ_SIZE)
+                    if not chunk:
                         break
                     
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        self.progress_signal.emit(self.thread_id, os.path.basename(self.save_path), downloaded, file_size)
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    self.progress_signal.emit(self.thread_id, file_name, downloaded, file_size)
                         
-            if self.is_canceled:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+            if canceled():
+                self._remove_part()
                 return
                 
-            # 重命名临时文件为最终文件
-            if os.path.exists(self.save_path):
-                os.remove(self.save_path)
-            os.rename(temp_path, self.save_path)
+            # 原子地用临时文件覆盖最终文件
+            os.replace(temp_path, self.save_path)
             
-            self.finished_signal.emit(self.thread_id, os.path.basename(self.save_path))
+            self.finished_signal.emit(self.thread_id, file_name)
             
         except Exception as e:
-            self.error_signal.emit(self.thread_id, os.path.basename(self.save_path), str(e))
-            if os.path.exists(f"{self.save_path}.part"):
-                os.remove(f"{self.save_path}.part")
+            # 取消时关闭连接导致的读取异常不算错误
+            if not self._cancel_event.is_set():
+                self.error_signal.emit(self.thread_id, os.path.basename(self.save_path), str(e))
+            self._remove_part()
+        
+        finally:
+            self._response = None
+    
+    def _remove_part(self):
+        """删除临时文件"""
+        try:
+            os.remove(f"{self.save_path}.part")
+        except FileNotFoundError:
+            pass
     
     def cancel(self):
         """取消下载"""
-        self.is_canceled = True
+        self._cancel_event.set()
+        # 关闭连接，让阻塞中的读取尽快返回，而不是等到下一块数据到达
+        response = self._response
+        if response is not None:
+            response.close()
 
 
 class ChunkDownloader(QObject):
@@ -101,30 +308,35 @@ class ChunkDownloader(QObject):
     finished_signal = pyqtSignal(str)  # 完成信号(文件路径)
     error_signal = pyqtSignal(str)  # 错误信号(错误信息)
     
-    def __init__(self, url, save_path, chunk_count=10, headers=None, proxies=None):
+    def __init__(self, url, save_path, chunk_count=10, headers=None, proxies=None, session=None):
         super().__init__()
         self.url = url
         self.save_path = save_path
         self.chunk_count = chunk_count
         self.headers = headers or {}
         self.proxies = proxies
-        self.workers = []
-        self.mutex = QMutex()
-        self.downloaded_chunks = []
-        self.is_canceled = False
-        self.temp_dir = f"{save_path}.chunks"
+        self.session = session or requests.Session()
+        self.executor = None
+        self.lock = threading.Lock()
+        self.finished_chunks = 0
+        self.has_error = False
+        self._cancel_event = threading.Event()
+        self._responses = set()
+        self.part_path = f"{save_path}.part"
+        self.fd = None
         self.total_size = 0
         self.downloaded_size = 0
+    
+    @property
+    def is_canceled(self):
+        """是否已取消"""
+        return self._cancel_event.is_set()
         
     def start(self):
         """开始下载"""
         try:
-            # 创建临时目录
-            if not os.path.exists(self.temp_dir):
-                os.makedirs(self.temp_dir)
-                
             # 获取文件大小
-            response = requests.head(
+            response = self.session.head(
                 self.url,
                 headers=self.headers,
                 proxies=self.proxies,
@@ -133,124 +345,204 @@ class ChunkDownloader(QObject):
             response.raise_for_status()
             
             self.total_size = int(response.headers.get('Content-Length', 0))
-            if self.total_size <= 0:
-                self.error_signal.emit("无法获取文件大小信息")
-                return
+            accept_ranges = response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+            
+            # 服务器不支持Range、大小未知或文件较小时，退化为单连接下载
+            if not accept_ranges or self.total_size < CHUNK_MIN_SIZE:
+                self.chunk_count = 1
                 
+            # 预先分配完整大小的临时文件，各块直接写入自己的位置，无需再合并
+            target_dir = os.path.dirname(self.save_path)
+            if target_dir:
+                os.makedirs(target_dir, exist_ok=True)
+            with open(self.part_path, 'wb') as f:
+                f.truncate(self.total_size)
+            
+            if _HAS_PWRITE:
+                self.fd = os.open(self.part_path, os.O_WRONLY)
+            
             # 计算每个块的大小
             chunk_size = self.total_size // self.chunk_count
             
-            # 创建下载线程
+            # 使用固定大小的线程池下载各个块
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.chunk_count,
+                thread_name_prefix="chunk-dl"
+            )
             for i in range(self.chunk_count):
                 start = i * chunk_size
                 end = (i + 1) * chunk_size - 1 if i < self.chunk_count - 1 else self.total_size - 1
                 
-                chunk_path = os.path.join(self.temp_dir, f"chunk_{i}")
                 headers = self.headers.copy()
-                headers['Range'] = f'bytes={start}-{end}'
+                if self.chunk_count > 1:
+                    headers['Range'] = f'bytes={start}-{end}'
                 
-                worker = QThread()
-                worker.run = self._download_chunk(i, headers, chunk_path, end - start + 1)
-                worker.finished.connect(lambda i=i, path=chunk_path: self._on_chunk_finished(i, path))
+                if self.fd is not None and self.total_size > 0 and hasattr(os, 'posix_fadvise'):
+                    # 提示内核每个块是顺序写入，而不是把并发写入当作随机访问
+                    os.posix_fadvise(self.fd, start, end - start + 1, os.POSIX_FADV_SEQUENTIAL)
                 
-                self.workers.append(worker)
-                worker.start()
+                future = self.executor.submit(self._download_chunk, i, headers, start)
+                future.add_done_callback(lambda f, i=i: self._on_chunk_finished(i))
+            
+            # 不再提交新任务，线程在所有块完成后自动退出
+            self.executor.shutdown(wait=False)
         
         except Exception as e:
             self.error_signal.emit(f"开始下载出错: {str(e)}")
+            self._close_fd()
             self._cleanup()
             
-    def _download_chunk(self, chunk_id, headers, chunk_path, chunk_size):
-        """下载块函数"""
-        def run():
+    def _download_chunk(self, chunk_id, headers, offset):
+        """下载块函数，在线程池中执行
+        
+        Args:
+            chunk_id: 块ID
+            headers: 包含Range的请求头
+            offset: 块在文件中的起始位置
+        """
+        response = None
+        try:
+            response = self.session.get(
+                self.url, 
+                headers=headers,
+                proxies=self.proxies,
+                stream=True,
+                timeout=30
+            )
+            with self.lock:
+                self._responses.add(response)
+            response.raise_for_status()
+            
+            downloaded = 0
+            canceled = self._cancel_event.is_set
+            
+            raw = response.raw
+            raw.decode_content = True
+            
+            fd = self.fd
+            f = None
+            if fd is None:
+                f = open(self.part_path, 'r+b')
+                f.seek(offset)
+            
             try:
-                response = requests.get(
-                    self.url, 
-                    headers=headers,
-                    proxies=self.proxies,
-                    stream=True,
-                    timeout=30
-                )
-                response.raise_for_status()
-                
-                downloaded = 0
-                
-                with open(chunk_path, 'wb') as f:
-                    for data in response.iter_content(chunk_size=8192):
-                        if self.is_canceled:
-                            break
-                            
-                        if data:
-                            f.write(data)
-                            downloaded += len(data)
-                            
-                            # 更新总下载进度
-                            self.mutex.lock()
-                            self.downloaded_size += len(data)
-                            self.progress_signal.emit(self.downloaded_size, self.total_size)
-                            self.mutex.unlock()
-            
-            except Exception as e:
-                self.error_signal.emit(f"下载块 {chunk_id} 出错: {str(e)}")
+                position = offset
+                while not canceled():
+                    data = raw.read(DOWNLOAD_READ_SIZE)
+                    if not data:
+                        break
+                    
+                    if f is None:
+                        self._pwrite_all(fd, data, position)
+                    else:
+                        f.write(data)
+                    position += len(data)
+                    downloaded += len(data)
+                    
+                    # 更新总下载进度，锁只保护计数，信号在锁外发送
+                    with self.lock:
+                        self.downloaded_size += len(data)
+                        downloaded_size = self.downloaded_size
+                    self.progress_signal.emit(downloaded_size, self.total_size)
+            finally:
+                if f is not None:
+                    f.close()
+        
+        except Exception as e:
+            # 取消时关闭连接导致的读取异常不算错误
+            if not self._cancel_event.is_set():
+                with self.lock:
+                    first_error = not self.has_error
+                    self.has_error = True
+                if first_error:
+                    # 任何一块失败整个下载都无法完成，只报告一次错误并停止其余块
+                    self.error_signal.emit(f"下载块 {chunk_id} 出错: {str(e)}")
+                    self._stop_chunks()
         
-        return run
+        finally:
+            with self.lock:
+                self._responses.discard(response)
     
-    def _on_chunk_finished(self, chunk_id, chunk_path):
-        """块下载完成回调"""
-        if self.is_canceled:
-            return
-            
-        self.mutex.lock()
-        self.downloaded_chunks.append((chunk_id, chunk_path))
+    @staticmethod
+    def _pwrite_all(fd, data, position):
+        """在指定位置写入全部数据，不移动文件指针
+        
+        Args:
+            fd: 文件描述符
+            data: 要写入的数据
+            position: 写入的起始位置
+        """
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, position)
+            position += written
+            view = view[written:]
+    
+    def _on_chunk_finished(self, chunk_id):
+        """块下载完成回调（取消的块同样会触发）"""
+        with self.lock:
+            self.finished_chunks += 1
+            all_finished = self.finished_chunks == self.chunk_count
         
-        # 检查是否所有块都已下载完成
-        if len(self.downloaded_chunks) == self.chunk_count:
-            self._merge_chunks()
+        # 检查是否所有块都已结束，最后一个块负责关闭共享的文件描述符
+        if not all_finished:
+            return
         
-        self.mutex.unlock()
+        self._close_fd()
+        if self.has_error or self.is_canceled:
+            # 有块下载失败（错误已经发送过）或下载已取消。
+            # 取消时各块可能仍持有临时文件的句柄，cancel中的删除在Windows下会失败，这里再删除一次
+            self._cleanup()
+        else:
+            self._finish()
     
-    def _merge_chunks(self):
-        """合并所有块"""
+    def _finish(self):
+        """所有块下载完成后，将临时文件重命名为目标文件"""
         try:
-            # 按ID排序
-            self.downloaded_chunks.sort(key=lambda x: x[0])
-            
-            # 创建目标目录
-            target_dir = os.path.dirname(self.save_path)
-            if not os.path.exists(target_dir):
-                os.makedirs(target_dir)
-            
-            # 合并块
-            with open(self.save_path, 'wb') as outfile:
-                for _, chunk_path in self.downloaded_chunks:
-                    with open(chunk_path, 'rb') as infile:
-                        outfile.write(infile.read())
-            
-            # 清理
-            self._cleanup()
-            
+            os.replace(self.part_path, self.save_path)
             self.finished_signal.emit(self.save_path)
         
         except Exception as e:
-            self.error_signal.emit(f"合并文件块出错: {str(e)}")
+            self.error_signal.emit(f"保存下载文件出错: {str(e)}")
             self._cleanup()
     
+    def _close_fd(self):
+        """关闭各块共用的文件描述符"""
+        fd, self.fd = self.fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
     def _cleanup(self):
-        """清理临时文件和目录"""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        """清理临时文件"""
+        try:
+            os.remove(self.part_path)
+        except OSError:
+            pass
+    
+    def _stop_chunks(self):
+        """停止所有块：未开始的块直接取消，正在下载的块关闭连接后立即退出"""
+        self._cancel_event.set()
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        with self.lock:
+            responses = list(self._responses)
+        for response in responses:
+            response.close()
     
     def cancel(self):
         """取消下载"""
-        self.is_canceled = True
-        for worker in self.workers:
-            worker.terminate()
+        self._stop_chunks()
         self._cleanup()
 
 
 class BlenderVersionInfo:
     """Blender版本信息"""
     
+    __slots__ = ('version', 'build_date', 'url', 'size', 'description')
+    
     def __init__(self, version, build_date=None, url=None, size=None, description=None):
         self.version = version
         self.build_date = build_date
@@ -290,6 +582,7 @@ class DownloadManager(QObject):
     download_progress = pyqtSignal(str, int, int)  # 下载进度(文件名, 当前进度, 总大小)
     download_finished = pyqtSignal(str, str)  # 下载完成(文件名, 保存路径)
     download_error = pyqtSignal(str, str)  # 下载错误(文件名, 错误信息)
+    download_started = pyqtSignal(str)  # 下载开始(文件名)，排队的下载轮到时也会发出
     download_all_finished = pyqtSignal()  # 所有下载完成
     version_list_updated = pyqtSignal(list)  # 版本列表更新(版本列表)
     
@@ -319,45 +612,167 @@ class DownloadManager(QObject):
                     'https': proxy
                 }
         
+        # 所有请求共用的HTTP会话，复用连接
+        self.session = self._create_session()
+        
+        # 限制同时进行的抓取请求数，避免并行抓取触发镜像站的频率限制
+        self._scrape_semaphore = threading.BoundedSemaphore(self.config.get('scrape_concurrency', 8))
+        
         # 创建下载目录
-        if not os.path.exists(self.download_dir):
-            os.makedirs(self.download_dir)
+        os.makedirs(self.download_dir, exist_ok=True)
         
-        # 当前下载任务
+        # 当前下载任务，同时进行的下载数有上限，超出的排队等待
         self.current_downloads = {}
+        self.max_concurrent_downloads = self.config.get('max_concurrent_downloads', 2)
+        self._pending_downloads = deque()
         
         # 版本缓存
         self.version_cache_file = os.path.join(self.download_dir, 'version_cache.json')
         self.version_cache = {}
+        # 文件URL -> 格式化的文件大小。发布后的文件大小不会变化，不随版本列表一起修剪
+        self.file_sizes = {}
+        self._cache_save_lock = threading.Lock()
+        self.mirror_cache_file = os.path.join(self.download_dir, 'mirror_cache.json')
+        
+        # 下载页面 -> (Windows下载URL, 获取时间)
+        self._url_cache = {}
         self.load_version_cache()
     
+    def _create_session(self):
+        """创建HTTP会话
+        
+        连接池大小按下载线程数设置，避免多线程下载时连接被丢弃；
+        对连接错误和5xx/429响应自动重试
+        
+        Returns:
+            requests.Session: HTTP会话
+        """
+        pool_size = max(self.thread_count, 10) + 4
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _scrape_request(self, method, url, timeout, **kwargs):
+        """发送抓取页面或探测文件大小的请求
+        
+        并发数受scrape_concurrency限制；连接错误和429/5xx由会话按指数退避自动重试
+        
+        Args:
+            method: 请求方法，GET或HEAD
+            url: 请求地址
+            timeout: 超时时间（秒）
+            **kwargs: 传给session.request的其他参数
+            
+        Returns:
+            requests.Response: 响应对象
+        """
+        with self._scrape_semaphore:
+            return self.session.request(method, url, timeout=timeout, proxies=self.proxies, **kwargs)
+    
     def load_version_cache(self):
         """加载版本缓存"""
         try:
-            if os.path.exists(self.version_cache_file):
-                with open(self.version_cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    for version, data in cache_data.items():
-                        self.version_cache[version] = BlenderVersionInfo.from_dict(data)
-                    
-                    self.logger.info(f"已加载 {len(self.version_cache)} 个版本缓存")
+            # 一次读入全部字节再解析，省去文本层逐块解码
+            with open(self.version_cache_file, 'rb') as f:
+                cache_data = json.loads(f.read())
+            
+            # 旧格式的缓存文件只有版本字典，没有文件大小
+            if isinstance(cache_data.get('versions'), dict):
+                self.file_sizes.update(cache_data.get('file_sizes', {}))
+                cache_data = cache_data['versions']
+            
+            from_dict = BlenderVersionInfo.from_dict
+            for version, data in cache_data.items():
+                self.version_cache[version] = from_dict(data)
+            self._remember_sizes(self.version_cache.values())
+            
+            self.logger.info(f"已加载 {len(self.version_cache)} 个版本缓存")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.error(f"加载版本缓存出错: {str(e)}")
     
-    def save_version_cache(self):
-        """保存版本缓存"""
+    def save_version_cache(self, background=False):
+        """保存版本缓存
+        
+        Args:
+            background: 是否在后台线程中写入文件
+        """
+        # 在调用线程中取快照，后台写入时不会与缓存的修改冲突
+        cache_data = {
+            'versions': {version: info.to_dict() for version, info in self.version_cache.items()},
+            'file_sizes': dict(self.file_sizes)
+        }
+        
+        if background:
+            threading.Thread(
+                target=self._write_version_cache,
+                args=(cache_data,),
+                daemon=True
+            ).start()
+        else:
+            self._write_version_cache(cache_data)
+    
+    def _write_version_cache(self, cache_data):
+        """将版本缓存快照写入文件
+        
+        Args:
+            cache_data: 版本缓存字典
+        """
         try:
-            cache_data = {}
-            for version, info in self.version_cache.items():
-                cache_data[version] = info.to_dict()
-                
-            with open(self.version_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=4)
-                
+            self._write_cache_file(self.version_cache_file, cache_data)
             self.logger.info("版本缓存已保存")
         except Exception as e:
             self.logger.error(f"保存版本缓存出错: {str(e)}")
     
+    def _write_cache_file(self, file_path, data):
+        """写入缓存文件，先写临时文件再原子替换
+        
+        多个刷新线程同时写入时，文件内容总是某一次完整的写入
+        
+        Args:
+            file_path: 缓存文件路径
+            data: 要写入的数据
+        """
+        temp_path = f"{file_path}.tmp"
+        # 缓存文件无需手工编辑，使用紧凑格式并一次性写入
+        content = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        with self._cache_save_lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(temp_path, file_path)
+    
+    def _remember_sizes(self, versions):
+        """记录版本信息中已知的文件大小
+        
+        Args:
+            versions: 版本信息对象列表
+            
+        Returns:
+            bool: 是否记录了新的文件大小
+        """
+        file_sizes = self.file_sizes
+        changed = False
+        for info in versions:
+            # 只有直接指向安装包的URL才有确定的大小
+            if (info.url and info.url.endswith(('.zip', '.msi'))
+                    and info.size and info.size != "未知"
+                    and file_sizes.get(info.url) != info.size):
+                file_sizes[info.url] = info.size
+                changed = True
+        return changed
+    
     def _get_versions_from_direct_download(self):
         """直接从下载目录获取所有版本列表"""
         versions = []
@@ -367,38 +782,22 @@ class DownloadManager(QObject):
             
             self.logger.info(f"正在直接访问Blender下载目录: {release_url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
             # 获取所有版本目录
-            releases_resp = requests.get(
-                release_url, 
-                headers=headers,
-                timeout=20, 
-                proxies=self.proxies
-            )
+            releases_resp = self._scrape_request('GET', release_url, timeout=20)
             releases_resp.raise_for_status()
             
-            releases_soup = BeautifulSoup(releases_resp.text, 'html.parser')
-            release_links = releases_soup.find_all('a')
-            
             # 查找Blender版本目录
             blender_versions = []
-            for link in release_links:
-                href = link.get('href')
+            for href in _iter_hrefs(releases_resp.text):
                 if href and href.startswith('Blender') and href.endswith('/'):
-                    version_match = re.search(r'Blender(\d+\.\d+)', href)
+                    version_match = _RELEASE_DIR_RE.search(href)
                     if version_match:
                         blender_versions.append((version_match.group(1), href))
             
             self.logger.info(f"找到 {len(blender_versions)} 个Blender版本目录")
             
             # 按版本号排序
-            blender_versions.sort(
-                key=lambda v: [int(n) for n in v[0].split('.')], 
-                reverse=True
-            )
+            blender_versions.sort(key=lambda v: _version_key(v[0]), reverse=True)
             
             # 处理所有可用版本，但不获取下载链接
             for version, dir_href in blender_versions:
@@ -454,33 +853,20 @@ class DownloadManager(QObject):
             # 否则，获取版本目录，查找Windows下载链接
             self.logger.info(f"获取版本 {version_info.version} 的下载链接: {version_info.url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            version_resp = requests.get(
-                version_info.url, 
-                headers=headers,
-                timeout=20, 
-                proxies=self.proxies
-            )
+            version_resp = self._scrape_request('GET', version_info.url, timeout=20)
             version_resp.raise_for_status()
             
-            version_soup = BeautifulSoup(version_resp.text, 'html.parser')
-            file_links = version_soup.find_all('a')
-            
             # 查找Windows版本
             windows_files = []
-            for link in file_links:
-                href = link.get('href')
+            for href, size_bytes in _iter_index_entries(version_resp.text):
                 if href and 'windows' in href.lower() and 'x64' in href.lower() and href.endswith('.zip'):
-                    version_match = re.search(r'blender-(\d+\.\d+\.\d+)-', href)
+                    version_match = _RELEASE_FILE_RE.search(href)
                     if version_match:
                         exact_version = version_match.group(1)
                         # 检查版本前两个数字是否匹配
                         major_version = version_info.version.split('.')[0]
                         if exact_version.startswith(major_version):
-                            windows_files.append((exact_version, href))
+                            windows_files.append((exact_version, href, size_bytes))
             
             self.logger.info(f"在版本 {version_info.version} 中找到 {len(windows_files)} 个Windows下载文件")
             
@@ -489,34 +875,21 @@ class DownloadManager(QObject):
                 return None
                 
             # 按版本号排序
-            windows_files.sort(
-                key=lambda v: [int(n) if n.isdigit() else 0 for n in v[0].split('.')], 
-                reverse=True
-            )
+            windows_files.sort(key=lambda v: _version_key(v[0]), reverse=True)
             
             # 获取最新版本的下载链接
-            exact_version, file_href = windows_files[0]
+            exact_version, file_href, size_bytes = windows_files[0]
             file_url = urljoin(version_info.url, file_href)
             
-            # 获取文件大小
-            try:
-                head_resp = requests.head(
-                    file_url, 
-                    timeout=10, 
-                    proxies=self.proxies,
-                    headers=headers
-                )
-                if head_resp.status_code == 200:
-                    size_bytes = int(head_resp.headers.get('Content-Length', 0))
-                    file_size = self._format_size(size_bytes)
-                    self.logger.info(f"版本 {exact_version} 文件大小: {file_size}")
-                    # 更新版本信息
+            # 获取文件大小，目录列表中没有时才发送探测请求
+            if size_bytes is not None:
+                version_info.size = self._format_size(size_bytes)
+            else:
+                file_size = self._get_remote_file_size(file_url, exact_version)
+                if file_size != "未知":
                     version_info.size = file_size
-            except Exception as e:
-                self.logger.warning(f"获取文件大小失败: {str(e)}")
             
-            # 更新版本信息
-            version_info.version = exact_version
+            # 更新版本信息；version保持不变，它同时是版本缓存的键和下载ID
             version_info.description = f"Blender {exact_version} Windows 64位版本"
             
             self.logger.info(f"获取到版本 {exact_version} 的Windows下载链接: {file_url}")
@@ -555,32 +928,31 @@ class DownloadManager(QObject):
                     all_versions.extend(official_versions)
                     self.logger.info(f"从官方网站获取到 {len(official_versions)} 个版本")
             
-            # 去重并排序
+            # 一次遍历完成去重，保留每个版本第一次出现的条目
             unique_versions = {}
             for version in all_versions:
-                if version.version not in unique_versions:
-                    unique_versions[version.version] = version
-            
-            # 转换回列表
-            versions = list(unique_versions.values())
-            
-            # 按版本号排序（降序）
-            versions.sort(
-                key=lambda v: [int(n) if n.isdigit() else 0 for n in v.version.split('.')], 
-                reverse=True
-            )
-            
-            # 更新缓存并发送信号
-            for version in versions:
-                self.version_cache[version.version] = version
-            
-            # 保存缓存
-            self.save_version_cache()
-            
-            # 如果没有获取到任何版本，尝试使用缓存
-            if not versions and self.version_cache:
+                unique_versions.setdefault(version.version, version)
+            
+            if unique_versions:
+                # 缓存只保留本次获取到的版本，已下架的版本和其他来源的旧条目不再列出；
+                # 文件大小单独保存，不随之丢失
+                cache = self.version_cache
+                cache_dirty = unique_versions.keys() != cache.keys() or any(
+                    cache[key].url != info.url or cache[key].size != info.size
+                    for key, info in unique_versions.items()
+                )
+                if self._remember_sizes(unique_versions.values()):
+                    cache_dirty = True
+                self.version_cache = unique_versions
+                
+                # 仅在缓存内容有变化时于后台保存
+                if cache_dirty:
+                    self.save_version_cache(background=True)
+            elif self.version_cache:
                 self.logger.info("使用缓存的版本列表")
-                versions = list(self.version_cache.values())
+            
+            # 按版本号排序（降序），只排序一次
+            versions = sorted(self.version_cache.values(), key=lambda v: _version_key(v.version), reverse=True)
             
             # 发送信号
             if versions:
@@ -604,59 +976,85 @@ class DownloadManager(QObject):
             return []
     
     def _get_versions_from_mirror(self):
-        """从镜像网站获取版本列表"""
+        """从镜像网站获取版本列表，有效期内直接使用磁盘缓存"""
         versions = []
+        mirror_cache = read_json_file(self.mirror_cache_file, default={})
+        cached = mirror_cache.get(self.mirror_url)
+        if cached and time.time() - cached.get('time', 0) < MIRROR_CACHE_TTL:
+            from_dict = BlenderVersionInfo.from_dict
+            versions = [from_dict(data) for data in cached.get('versions', [])]
+            if versions:
+                self.logger.info(f"使用镜像版本缓存，共 {len(versions)} 个版本")
+                return versions
+        
         try:
             # 发送请求
             self.logger.info(f"正在连接镜像站点: {self.mirror_url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(
-                self.mirror_url, 
-                headers=headers,
-                timeout=15, 
-                proxies=self.proxies
-            )
+            response = self._scrape_request('GET', self.mirror_url, timeout=15)
             response.raise_for_status()
             
             # 解析HTML
             self.logger.info("正在解析镜像站点HTML内容...")
-            soup = BeautifulSoup(response.text, 'html.parser')
             
             # 查找版本链接
-            links = soup.find_all('a')
-            version_pattern = re.compile(r'blender-(\d+\.\d+)')
+            version_search = _MIRROR_DIR_RE.search
             
             found_versions = []
-            for link in links:
-                href = link.get('href')
-                if href and version_pattern.search(href):
-                    version_match = version_pattern.search(href)
-                    if version_match:
-                        version = version_match.group(1)
-                        found_versions.append((version, href))
+            for href in _iter_hrefs(response.text):
+                version_match = version_search(href)
+                if version_match:
+                    found_versions.append((version_match.group(1), href))
             
             self.logger.info(f"在镜像站点找到 {len(found_versions)} 个版本目录")
             
             # 按版本号排序（降序）
-            found_versions.sort(key=lambda x: [int(n) for n in x[0].split('.')], reverse=True)
+            found_versions.sort(key=lambda x: _version_key(x[0]), reverse=True)
             
-            # 获取最新的5个版本
-            latest_versions = found_versions[:5]
+            # 需要最新的5个有Windows版本的目录；多取几个候选，
+            # 以免有的目录中没有Windows安装包时凑不满
+            latest_versions = found_versions[:MIRROR_CANDIDATE_DIRS]
             self.logger.info(f"准备获取最新的 {len(latest_versions)} 个版本详情")
             
-            # 获取子页面
-            for version, href in latest_versions:
+            def fetch_subpage(item):
+                version, href = item
                 sub_url = urljoin(self.mirror_url, href)
                 self.logger.info(f"正在获取版本 {version} 的详情: {sub_url}")
-                sub_versions = self._get_versions_from_mirror_subpage(sub_url, version)
-                if sub_versions:
-                    versions.extend(sub_versions)
+                return self._get_versions_from_mirror_subpage(sub_url, version)
+            
+            if latest_versions:
+                # 先并行获取需要的目录数，按版本顺序取结果；
+                # 只有某个目录没有Windows安装包时才补充请求下一个候选
+                executor = ThreadPoolExecutor(max_workers=min(MIRROR_VERSION_DIRS, len(latest_versions)))
+                try:
+                    candidates = iter(latest_versions)
+                    futures = deque(executor.submit(fetch_subpage, item)
+                                    for item in islice(candidates, MIRROR_VERSION_DIRS))
+                    usable_dirs = 0
+                    while futures and usable_dirs < MIRROR_VERSION_DIRS:
+                        sub_versions = futures.popleft().result()
+                        if sub_versions:
+                            versions.extend(sub_versions)
+                            usable_dirs += 1
+                        else:
+                            next_item = next(candidates, None)
+                            if next_item is not None:
+                                futures.append(executor.submit(fetch_subpage, next_item))
+                finally:
+                    executor.shutdown(wait=False, cancel_futures=True)
             
             self.logger.info(f"从镜像站点共获取到 {len(versions)} 个可用版本")
+            
+            if versions:
+                mirror_cache[self.mirror_url] = {
+                    'time': time.time(),
+                    'versions': [info.to_dict() for info in versions]
+                }
+                try:
+                    self._write_cache_file(self.mirror_cache_file, mirror_cache)
+                except Exception as e:
+                    self.logger.error(f"保存镜像版本缓存出错: {str(e)}")
+            
             return versions
             
         except requests.exceptions.ConnectionError as e:
@@ -677,62 +1075,46 @@ class DownloadManager(QObject):
         versions = []
         try:
             # 发送请求
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(
-                url, 
-                headers=headers,
-                timeout=15, 
-                proxies=self.proxies
-            )
+            response = self._scrape_request('GET', url, timeout=15)
             response.raise_for_status()
             
-            # 解析HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 查找版本链接
-            links = soup.find_all('a')
-            version_pattern = re.compile(r'blender-(\d+\.\d+\.\d+)-windows-x64.zip')
+            # 查找版本链接，目录列表中已有的文件大小一并取出
+            version_search = _MIRROR_FILE_RE.search
             
             found_versions = []
-            for link in links:
-                href = link.get('href')
-                if href and version_pattern.search(href):
-                    version_match = version_pattern.search(href)
-                    if version_match:
-                        version_str = version_match.group(1)
-                        found_versions.append((version_str, href))
+            for href, size_bytes in _iter_index_entries(response.text):
+                version_match = version_search(href)
+                if version_match:
+                    found_versions.append((version_match.group(1), href, size_bytes))
             
             self.logger.info(f"在版本 {base_version} 目录中找到 {len(found_versions)} 个Windows版本")
             
             # 按版本号排序（降序）
-            found_versions.sort(key=lambda x: [int(n) for n in x[0].split('.')], reverse=True)
+            found_versions.sort(key=lambda x: _version_key(x[0]), reverse=True)
             
             # 获取最新的3个版本
             latest_versions = found_versions[:3]
-            
-            for version_str, href in latest_versions:
-                # 获取文件信息
-                file_url = urljoin(url, href)
-                file_size = "未知"
-                
-                # 尝试获取文件大小
-                try:
-                    head_resp = requests.head(
-                        file_url, 
-                        timeout=10, 
-                        proxies=self.proxies,
-                        headers=headers
+            file_urls = [urljoin(url, href) for _, href, _ in latest_versions]
+            
+            # 优先使用目录列表中的大小；发布后的文件大小不会变化，已缓存的直接使用；
+            # 都没有时才并行发送探测请求获取
+            known_sizes = self.file_sizes
+            file_sizes = [
+                self._format_size(size_bytes) if size_bytes is not None else known_sizes.get(file_url)
+                for (_, _, size_bytes), file_url in zip(latest_versions, file_urls)
+            ]
+            missing = [i for i, file_size in enumerate(file_sizes) if file_size is None]
+            if missing:
+                with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                    probed = executor.map(
+                        self._get_remote_file_size,
+                        [file_urls[i] for i in missing],
+                        [latest_versions[i][0] for i in missing]
                     )
-                    if head_resp.status_code == 200:
-                        size_bytes = int(head_resp.headers.get('Content-Length', 0))
-                        file_size = self._format_size(size_bytes)
-                        self.logger.info(f"版本 {version_str} 文件大小: {file_size}")
-                except Exception as e:
-                    self.logger.warning(f"获取版本 {version_str} 文件大小失败: {str(e)}")
-                
+                    for i, file_size in zip(missing, probed):
+                        file_sizes[i] = file_size
+            
+            for (version_str, _, _), file_url, file_size in zip(latest_versions, file_urls, file_sizes):
                 # 创建版本信息对象
                 version_info = BlenderVersionInfo(
                     version=version_str,
@@ -759,6 +1141,45 @@ class DownloadManager(QObject):
             self.logger.error(f"从镜像子页面获取版本列表出错: {str(e)}")
             return []
     
+    def _get_remote_file_size(self, file_url, version_str):
+        """通过只请求第一个字节的Range请求获取远程文件大小
+        
+        部分镜像对HEAD返回的Content-Length不可靠，且HEAD容易导致连接不能复用；
+        206响应的Content-Range中带有文件总大小
+        
+        Args:
+            file_url: 文件URL
+            version_str: 版本号，用于日志
+            
+        Returns:
+            str: 格式化的文件大小，失败时返回"未知"
+        """
+        try:
+            response = self._scrape_request(
+                'GET', file_url, timeout=10,
+                headers={'Range': 'bytes=0-0'},
+                stream=True
+            )
+            try:
+                if response.status_code == 206:
+                    # 显式读完仅1字节的响应体，close时连接才能放回连接池复用，而不是被丢弃
+                    response.raw.read()
+                    size_bytes = int(response.headers.get('Content-Range', '').rsplit('/', 1)[-1])
+                elif response.status_code == 200:
+                    # 服务器忽略了Range，不读取完整文件，直接使用Content-Length
+                    size_bytes = int(response.headers.get('Content-Length', 0))
+                else:
+                    return "未知"
+            finally:
+                response.close()
+            
+            file_size = self._format_size(size_bytes)
+            self.logger.info(f"版本 {version_str} 文件大小: {file_size}")
+            return file_size
+        except Exception as e:
+            self.logger.warning(f"获取版本 {version_str} 文件大小失败: {str(e)}")
+        return "未知"
+    
     def _get_versions_from_official(self):
         """从官方网站获取版本列表"""
         versions = []
@@ -766,21 +1187,15 @@ class DownloadManager(QObject):
             # 发送请求
             self.logger.info(f"正在连接官方网站: {self.official_url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(
-                self.official_url, 
-                headers=headers,
-                timeout=20, 
-                proxies=self.proxies
-            )
+            response = self._scrape_request('GET', self.official_url, timeout=20)
             response.raise_for_status()
             
-            # 解析HTML
+            # 解析HTML（BeautifulSoup只在回退到官网时才需要，按需导入）
+            # 这里只用到链接和标题，只为这两种标签建树，其余元素直接跳过
+            from bs4 import BeautifulSoup, SoupStrainer
+            
             self.logger.info("正在解析官方网站HTML内容...")
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'html.parser', parse_only=SoupStrainer(['a', 'title']))
             
             # 调试信息：记录页面内容
             self.logger.debug(f"官方页面标题: {soup.title.string if soup.title else '无标题'}")
@@ -798,16 +1213,15 @@ class DownloadManager(QObject):
             if not download_links:
                 download_links = []
                 for link in soup.find_all('a'):
-                    if link.get('href') and 'download' in link.get('href').lower():
-                        if 'blender' in link.get_text().lower():
-                            download_links.append(link)
+                    href = link.get('href')
+                    if href and 'download' in href.lower() and 'blender' in link.get_text().lower():
+                        download_links.append(link)
                 self.logger.info(f"尝试通用查找方法，找到 {len(download_links)} 个可能的下载链接")
             
-            version_pattern = re.compile(r'Blender (\d+\.\d+\.\d+)')
-            
+            # 先收集各版本的下载页面
+            candidates = []
             for link in download_links:
-                text = link.get_text()
-                version_match = version_pattern.search(text)
+                version_match = _OFFICIAL_VERSION_RE.search(link.get_text())
                 
                 if version_match:
                     version_str = version_match.group(1)
@@ -822,22 +1236,31 @@ class DownloadManager(QObject):
                         if not download_page_url.startswith('http'):
                             download_page_url = urljoin(self.official_url, download_page_url)
                         
-                        # 获取Windows下载URL
-                        windows_url = self._get_windows_download_url(download_page_url)
-                        
-                        if windows_url:
-                            self.logger.info(f"找到版本 {version_str} 的Windows下载链接: {windows_url}")
-                            
-                            # 创建版本信息对象
-                            version_info = BlenderVersionInfo(
-                                version=version_str,
-                                url=windows_url,
-                                description=f"Blender {version_str} Windows 64位版本"
-                            )
-                            
-                            versions.append(version_info)
-                        else:
-                            self.logger.warning(f"未能获取版本 {version_str} 的Windows下载链接")
+                        candidates.append((version_str, download_page_url))
+            
+            # 并行获取各下载页面中的Windows下载URL，map按提交顺序返回结果
+            windows_urls = []
+            if candidates:
+                with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+                    windows_urls = list(executor.map(
+                        self._get_windows_download_url,
+                        [download_page_url for _, download_page_url in candidates]
+                    ))
+            
+            for (version_str, _), windows_url in zip(candidates, windows_urls):
+                if windows_url:
+                    self.logger.info(f"找到版本 {version_str} 的Windows下载链接: {windows_url}")
+                    
+                    # 创建版本信息对象
+                    version_info = BlenderVersionInfo(
+                        version=version_str,
+                        url=windows_url,
+                        description=f"Blender {version_str} Windows 64位版本"
+                    )
+                    
+                    versions.append(version_info)
+                else:
+                    self.logger.warning(f"未能获取版本 {version_str} 的Windows下载链接")
             
             self.logger.info(f"从官方网站获取到 {len(versions)} 个可用版本")
             return versions
@@ -856,89 +1279,85 @@ class DownloadManager(QObject):
             return []
     
     def _get_windows_download_url(self, download_page_url):
-        """获取Windows下载URL"""
+        """获取Windows下载URL，同一次运行中相同的下载页面只解析一次
+        
+        未找到的结果只缓存一小段时间，之后重试时会重新获取
+        """
+        cached = self._url_cache.get(download_page_url)
+        if cached is not None:
+            windows_url, cached_time = cached
+            if windows_url is not None or time.monotonic() - cached_time < URL_MISS_CACHE_TTL:
+                return windows_url
+        
+        windows_url = self._find_windows_download_url(download_page_url)
+        self._url_cache[download_page_url] = (windows_url, time.monotonic())
+        return windows_url
+    
+    def _find_windows_download_url(self, download_page_url):
+        """从下载页面中查找Windows下载URL"""
         try:
             # 发送请求
             self.logger.info(f"正在获取下载页面: {download_page_url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(
-                download_page_url, 
-                headers=headers,
-                timeout=15, 
-                proxies=self.proxies
-            )
+            response = self._scrape_request('GET', download_page_url, timeout=15)
             response.raise_for_status()
             
             # 解析HTML
+            from bs4 import BeautifulSoup
+            
             soup = BeautifulSoup(response.text, 'html.parser')
             self.logger.info(f"成功获取页面, 页面标题: {soup.title.string if soup.title else '无标题'}")
             
-            # 首先尝试查找直接包含Windows下载链接的按钮
-            download_buttons = soup.find_all('a', text=lambda t: t and 'Download' in t)
-            self.logger.info(f"找到 {len(download_buttons)} 个下载按钮")
-            
-            # 查找包含Windows相关文本的下载按钮
-            for button in download_buttons:
-                # 检查按钮及其周围是否有Windows相关文本
-                button_text = button.get_text()
-                if 'Windows' in button_text:
-                    href = button.get('href')
-                    if href:
+            # 一次遍历所有链接，按优先级查找：
+            # 1. 文本为Download且本身或父元素提到Windows的下载按钮，找到即返回
+            # 2. 明确的Windows安装包链接
+            # 3. 链接地址或文本包含Windows相关信息的链接
+            installer_href = None
+            fallback_href = None
+            for link in soup.find_all('a', href=True):
+                href = link['href']
+                if not href:
+                    continue
+                
+                string = link.string
+                if string and 'Download' in string:
+                    # 检查按钮本身及其父元素是否有Windows相关文本
+                    in_button = 'Windows' in string
+                    parent = link.parent
+                    if in_button or (parent and 'Windows' in parent.get_text()):
                         if not href.startswith('http'):
                             href = urljoin(download_page_url, href)
-                        self.logger.info(f"找到Windows下载按钮链接: {href}")
-                        return href
-                
-                # 检查按钮周围的元素
-                parent = button.parent
-                if parent:
-                    parent_text = parent.get_text()
-                    if 'Windows' in parent_text:
-                        href = button.get('href')
-                        if href:
-                            if not href.startswith('http'):
-                                href = urljoin(download_page_url, href)
+                        if in_button:
+                            self.logger.info(f"找到Windows下载按钮链接: {href}")
+                        else:
                             self.logger.info(f"找到Windows下载按钮(父元素)链接: {href}")
-                            return href
-            
-            # 如果没找到，尝试更通用的方法，查找所有链接
-            self.logger.info("未找到直接的Windows下载按钮，尝试查找所有链接")
-            all_links = soup.find_all('a')
-            
-            # 首先尝试查找明确的Windows安装程序链接
-            for link in all_links:
-                href = link.get('href')
-                if not href:
-                    continue
+                        return href
                 
-                href_lower = href.lower()
-                # 检查是否是明确的Windows安装包链接
-                if ('windows' in href_lower or 'win64' in href_lower) and (href_lower.endswith('.zip') or href_lower.endswith('.msi')):
-                    if not href.startswith('http'):
-                        href = urljoin(download_page_url, href)
-                    self.logger.info(f"找到Windows安装包链接: {href}")
-                    return href
-            
-            # 如果仍未找到，尝试查找所有下载链接并判断是否包含Windows相关信息
-            for link in all_links:
-                href = link.get('href')
-                if not href:
+                if installer_href is not None:
                     continue
                 
-                link_text = link.get_text().lower()
                 href_lower = href.lower()
+                href_is_windows = 'windows' in href_lower or 'win64' in href_lower
                 
-                # 如果链接文本包含Windows或链接指向.zip/.msi文件
-                if ('windows' in link_text or 'win64' in link_text or 
-                    'windows' in href_lower or 'win64' in href_lower):
-                    if not href.startswith('http'):
-                        href = urljoin(download_page_url, href)
-                    self.logger.info(f"找到可能的Windows相关链接: {href}")
-                    return href
+                # 检查是否是明确的Windows安装包链接
+                if href_is_windows and href_lower.endswith(('.zip', '.msi')):
+                    installer_href = href
+                elif fallback_href is None:
+                    link_text = link.get_text().lower()
+                    if href_is_windows or 'windows' in link_text or 'win64' in link_text:
+                        fallback_href = href
+            
+            if installer_href:
+                if not installer_href.startswith('http'):
+                    installer_href = urljoin(download_page_url, installer_href)
+                self.logger.info(f"找到Windows安装包链接: {installer_href}")
+                return installer_href
+            
+            if fallback_href:
+                if not fallback_href.startswith('http'):
+                    fallback_href = urljoin(download_page_url, fallback_href)
+                self.logger.info(f"找到可能的Windows相关链接: {fallback_href}")
+                return fallback_href
             
             # 如果所有方法都失败，记录错误并返回None
             self.logger.warning(f"在下载页面未找到Windows下载链接: {download_page_url}")
@@ -967,6 +1386,12 @@ class DownloadManager(QObject):
             str: 下载ID，用于标识下载任务，如果下载失败则返回None
         """
         try:
+            # 同一版本已在下载或排队时不重复添加，返回已有任务的ID
+            download_id = version_info.version
+            if download_id in self.current_downloads or self.is_download_queued(download_id):
+                self.logger.info(f"{download_id} 已在下载或等待队列中")
+                return download_id
+            
             # 获取实际下载URL
             download_url = None
             if version_info.url.endswith('.zip') or version_info.url.endswith('.msi'):
@@ -982,22 +1407,21 @@ class DownloadManager(QObject):
             # 使用原始的下载逻辑，但使用新获取的URL
             version_info.url = download_url
             
-            # 以下为原始下载逻辑
-            download_id = version_info.version
+            # 同时进行的下载已达上限时排队，等有下载结束后再开始
+            if len(self.current_downloads) >= self.max_concurrent_downloads:
+                self._pending_downloads.append(version_info)
+                self.logger.info(f"同时下载数已达上限，{download_id} 加入等待队列")
+                return download_id
             
             # 检查下载目录
-            if not os.path.exists(self.download_dir):
-                os.makedirs(self.download_dir)
+            os.makedirs(self.download_dir, exist_ok=True)
             
             # 设置保存路径
             file_name = os.path.basename(version_info.url)
             save_path = os.path.join(self.download_dir, file_name)
             
             self.logger.info(f"开始下载 {download_id}，URL: {version_info.url}")
-            
-            # 如果已有下载任务，先取消
-            if download_id in self.current_downloads:
-                self.cancel_download(download_id)
+            self.download_started.emit(download_id)
             
             # 使用多线程下载
             if self.use_multi_thread and version_info.url.endswith('.zip'):
@@ -1006,7 +1430,8 @@ class DownloadManager(QObject):
                     url=version_info.url,
                     save_path=save_path,
                     chunk_count=self.thread_count,
-                    proxies=self.proxies
+                    proxies=self.proxies,
+                    session=self.session
                 )
                 
                 # 连接信号
@@ -1017,7 +1442,7 @@ class DownloadManager(QObject):
                     lambda path: self._on_download_finished(download_id, path)
                 )
                 downloader.error_signal.connect(
-                    lambda error: self.download_error.emit(download_id, error)
+                    lambda error: self._on_download_error(download_id, error)
                 )
                 
                 # 保存下载器
@@ -1032,16 +1457,12 @@ class DownloadManager(QObject):
             
             else:
                 # 使用单线程下载
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                
                 worker = DownloadWorker(
                     thread_id=0,
                     url=version_info.url,
                     save_path=save_path,
-                    headers=headers,
-                    proxies=self.proxies
+                    proxies=self.proxies,
+                    session=self.session
                 )
                 
                 # 连接信号
@@ -1052,7 +1473,7 @@ class DownloadManager(QObject):
                     lambda tid, filename: self._on_download_finished(download_id, save_path)
                 )
                 worker.error_signal.connect(
-                    lambda tid, filename, error: self.download_error.emit(download_id, error)
+                    lambda tid, filename, error: self._on_download_error(download_id, error)
                 )
                 
                 # 保存下载器
@@ -1083,11 +1504,40 @@ class DownloadManager(QObject):
         # 发送下载完成信号
         self.download_finished.emit(download_id, save_path)
         
-        # 检查是否所有下载都已完成
+        # 开始排队中的下载，并检查是否所有下载都已完成
         self.current_downloads.pop(download_id, None)
+        self._start_pending_downloads()
         if not self.current_downloads:
             self.download_all_finished.emit()
     
+    def _on_download_error(self, download_id, error):
+        """下载出错回调，停止该下载并释放占用的名额"""
+        download = self.current_downloads.pop(download_id, None)
+        if download is None:
+            # 已取消或已报告过错误的下载
+            return
+        
+        # 先停止下载器，避免名额释放后仍在后台占用带宽
+        download['downloader'].cancel()
+        self.download_error.emit(download_id, error)
+        self._start_pending_downloads()
+    
+    def is_download_queued(self, download_id):
+        """下载是否在等待队列中
+        
+        Args:
+            download_id: 下载ID
+            
+        Returns:
+            bool: 是否正在排队
+        """
+        return any(info.version == download_id for info in self._pending_downloads)
+    
+    def _start_pending_downloads(self):
+        """在未达到同时下载上限时，依次开始排队中的下载"""
+        while self._pending_downloads and len(self.current_downloads) < self.max_concurrent_downloads:
+            self.download_blender(self._pending_downloads.popleft())
+    
     def cancel_download(self, download_id):
         """取消下载
         
@@ -1107,53 +1557,75 @@ class DownloadManager(QObject):
             elif isinstance(downloader, QThread):
                 downloader.terminate()
             
-            # 删除临时文件
-            save_path = download['save_path']
-            temp_path = f"{save_path}.part"
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            # 删除临时文件；分块下载器在最后一个块结束后自行删除，
+            # 此时各块可能仍持有文件句柄，这里删除在Windows下会失败
+            if not isinstance(downloader, ChunkDownloader):
+                save_path = download['save_path']
+                try:
+                    os.remove(f"{save_path}.part")
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    # 下载线程可能还没退出、仍占用着文件，线程退出时会自行删除
+                    self.logger.warning(f"删除临时文件失败: {str(e)}")
             
             # 清理下载记录
             self.current_downloads.pop(download_id, None)
+            self._start_pending_downloads()
             
             self.logger.info(f"已取消下载: {download_id}")
             return True
         
+        # 还在排队的下载直接移出队列
+        for version_info in self._pending_downloads:
+            if version_info.version == download_id:
+                self._pending_downloads.remove(version_info)
+                self.logger.info(f"已取消排队中的下载: {download_id}")
+                return True
+        
         return False
     
-    def extract_blender(self, zip_path, extract_dir=None):
+    def extract_blender(self, zip_path, extract_dir=None, expected_sha256=None):
         """解压Blender安装包
         
         Args:
             zip_path: ZIP文件路径
             extract_dir: 解压目标目录，默认为下载目录
+            expected_sha256: 期望的SHA-256，提供时先校验文件，不一致则不解压
             
         Returns:
             str: 解压后的Blender目录路径，失败则返回None
         """
+        import zipfile
+        
         try:
             if not os.path.exists(zip_path):
                 self.logger.error(f"解压失败，文件不存在: {zip_path}")
                 return None
             
+            # 在耗时的解压之前发现下载不完整或损坏的文件
+            if expected_sha256:
+                actual_sha256 = _file_sha256(zip_path)
+                if actual_sha256 != expected_sha256.lower():
+                    self.logger.error(f"解压失败，文件校验不一致: {zip_path}，期望 {expected_sha256}，实际 {actual_sha256}")
+                    return None
+            
             # 默认解压到下载目录
             if extract_dir is None:
                 extract_dir = self.download_dir
             
             # 确保解压目录存在
-            if not os.path.exists(extract_dir):
-                os.makedirs(extract_dir)
+            os.makedirs(extract_dir, exist_ok=True)
             
             self.logger.info(f"开始解压: {zip_path} 到 {extract_dir}")
             
-            # 解压ZIP文件
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            # 解压ZIP文件，中央目录同样通过大缓冲区读取
+            with open(zip_path, 'rb', buffering=EXTRACT_BUFFER_SIZE) as f, zipfile.ZipFile(f, 'r') as zip_ref:
+                # 中央目录只读取一次，既用于判断根目录，也用于逐个解压
+                members = zip_ref.infolist()
+                
                 # 获取ZIP文件中的根目录名称
-                root_dirs = set()
-                for name in zip_ref.namelist():
-                    parts = name.split('/')
-                    if len(parts) > 1:
-                        root_dirs.add(parts[0])
+                root_dirs = {info.filename.split('/', 1)[0] for info in members if '/' in info.filename}
                 
                 # 检查是否有根目录
                 if len(root_dirs) != 1:
@@ -1161,16 +1633,43 @@ class DownloadManager(QObject):
                     blender_dirname = os.path.basename(zip_path).replace('.zip', '')
                     extract_target = os.path.join(extract_dir, blender_dirname)
                     
-                    if os.path.exists(extract_target):
+                    # 旧目录删除失败（如文件被正在运行的Blender占用）时直接报错，
+                    # 不在残留的旧文件上继续解压
+                    try:
                         shutil.rmtree(extract_target)
-                    
-                    os.makedirs(extract_target)
-                    zip_ref.extractall(extract_target)
+                    except FileNotFoundError:
+                        pass
+                    os.makedirs(extract_target, exist_ok=True)
                     blender_dir = extract_target
                 else:
                     # 如果有单个根目录，直接解压
-                    zip_ref.extractall(extract_dir)
-                    blender_dir = os.path.join(extract_dir, list(root_dirs)[0])
+                    extract_target = extract_dir
+                    blender_dir = os.path.join(extract_dir, next(iter(root_dirs)))
+                
+            # 先串行创建所有目录，再把文件成员分给多个线程并行解压
+            target_root = os.path.abspath(extract_target)
+            directories = set()
+            files = []
+            for info in members:
+                dest_path = _member_path(info, target_root)
+                if info.is_dir():
+                    directories.add(dest_path)
+                else:
+                    directories.add(os.path.dirname(dest_path))
+                    files.append((info, dest_path))
+            
+            for directory in sorted(directories):
+                os.makedirs(directory, exist_ok=True)
+            
+            worker_count = max(1, min(EXTRACT_WORKERS, len(files)))
+            with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="extract") as executor:
+                # 按轮询方式分组，各线程分到的大小文件比较均匀
+                futures = [
+                    executor.submit(_extract_members, zip_path, files[i::worker_count])
+                    for i in range(worker_count)
+                ]
+                for future in futures:
+                    future.result()
             
             self.logger.info(f"解压完成，Blender目录: {blender_dir}")
             return blender_dir
@@ -1194,6 +1693,12 @@ class DownloadManager(QObject):
         self.use_multi_thread = self.config.get('use_multi_thread', True)
         self.thread_count = self.config.get('thread_count', 10)
         self.use_proxy = self.config.get('use_proxy', False)
+        self.max_concurrent_downloads = self.config.get('max_concurrent_downloads', 2)
+        
+        # 线程数可能变化，按新的连接池大小重建会话
+        # （不关闭旧会话，进行中的下载仍持有并使用它）
+        self.session = self._create_session()
+        self._scrape_semaphore = threading.BoundedSemaphore(self.config.get('scrape_concurrency', 8))
         
         # 更新代理配置
         self.proxies = None
@@ -1206,8 +1711,7 @@ class DownloadManager(QObject):
                 }
         
         # 创建下载目录
-        if not os.path.exists(self.download_dir):
-            os.makedirs(self.download_dir)
+        os.makedirs(self.download_dir, exist_ok=True)
     
     def _format_size(self, size_bytes):
         """格式化文件大小
@@ -1218,14 +1722,11 @@ class DownloadManager(QObject):
         Returns:
             str: 格式化后的大小
         """
-        if size_bytes < 1024:
+        # 每1024倍为一个单位，由二进制位数直接得到单位下标
+        unit_index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNIT_NAMES) - 1) if size_bytes > 0 else 0
+        if unit_index == 0:
             return f"{size_bytes}B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.2f}KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.2f}MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.2f}GB"
+        return f"{size_bytes / (1 << (10 * unit_index)):.2f}{_SIZE_UNIT_NAMES[unit_index]}"
 
 
 # 测试代码
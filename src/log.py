@@ -10,6 +10,7 @@
 # (at your option) any later version.
 
 import os
+import re
 import sys
 import logging
 import datetime
@@ -26,61 +27,131 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QColor, QTextCharFormat, QFont, QSyntaxHighlighter
 from PyQt6.QtCore import Qt, QRegularExpression, pyqtSignal, QDir
 
+# 压缩日志时每次读写的缓冲区大小
+LOG_COPY_BUFFER_SIZE = 1024 * 1024
+
+# 日志文件名：<类型>-<时间>.log 或压缩后的 .log.gz，分组1为日志类型，分组2为时间部分
+_LOG_NAME_RE = re.compile(r'^(vortex|blender|combined)-(.*)\.log(?:\.gz)?$')
+
+# 按从高位到低位排列的时间格式指令
+_SORTABLE_DIRECTIVES = 'YmdHMS'
+
+
+def _sortable_digit_count(name_format):
+    """计算可按数字排序的日志名格式中时间部分的数字位数
+    
+    只有按年、月、日、时、分、秒顺序排列（可省略末尾部分）且分隔符中不含数字的格式，
+    去掉分隔符后的数字才能直接比较大小。
+    
+    Args:
+        name_format: 日志文件名的时间格式
+    
+    Returns:
+        int: 时间部分的数字位数，格式不可排序时返回0
+    """
+    directives = ''.join(re.findall(r'%(.)', name_format))
+    if not directives or not _SORTABLE_DIRECTIVES.startswith(directives):
+        return 0
+    if any(char.isdigit() for char in re.sub(r'%.', '', name_format)):
+        return 0
+    return 4 + 2 * (len(directives) - 1)
+
+
+def _timestamp_key(timestamp, digit_count):
+    """将日志文件名中的时间部分转换为整数排序键
+    
+    时间之后的数字（如同一秒内多次启动时追加的序号"_2"）不计入排序键
+    
+    Args:
+        timestamp: 文件名中的时间部分
+        digit_count: 时间部分应有的数字位数
+    
+    Returns:
+        int: 排序键，无法转换时返回None
+    """
+    digits = ''.join(char for char in timestamp if char.isdigit())
+    if not digit_count or len(digits) < digit_count:
+        return None
+    return int(digits[:digit_count])
+
 
 class LogHighlighter(QSyntaxHighlighter):
     """日志语法高亮器"""
     
+    # 所有高亮器共用的组合模式和各分组对应的格式，第一次创建高亮器时构建
+    _PATTERN = None
+    _FORMATS = None
+    
     def __init__(self, parent=None):
         super(LogHighlighter, self).__init__(parent)
         
-        self.highlighting_rules = []
+        if LogHighlighter._PATTERN is None:
+            LogHighlighter._PATTERN, LogHighlighter._FORMATS = self._build_rules()
+    
+    @staticmethod
+    def _build_rules():
+        """构建高亮规则
+        
+        所有关键字合并为一个带命名分组的模式，每个文本块只需扫描一次；
+        级别关键字不区分大小写，标识名称仍区分大小写
+        
+        Returns:
+            tuple: (QRegularExpression, 按分组序号排列的QTextCharFormat列表，下标0不使用)
+        """
+        rules = []
         
         # 错误格式
         error_format = QTextCharFormat()
         error_format.setForeground(QColor(255, 0, 0))  # 红色
         error_format.setFontWeight(QFont.Weight.Bold)
-        error_pattern = QRegularExpression(r'ERROR|Error|error|Exception|EXCEPTION|exception')
-        self.highlighting_rules.append((error_pattern, error_format))
+        # 不加单词边界，以便高亮FileNotFoundError、RuntimeException等异常类名
+        rules.append(('error', r'error|exception', error_format))
         
         # 警告格式
         warning_format = QTextCharFormat()
         warning_format.setForeground(QColor(255, 165, 0))  # 橙色
-        warning_pattern = QRegularExpression(r'WARNING|Warning|warning')
-        self.highlighting_rules.append((warning_pattern, warning_format))
+        rules.append(('warning', r'\bwarning\b', warning_format))
         
         # 信息格式
         info_format = QTextCharFormat()
         info_format.setForeground(QColor(0, 128, 0))  # 绿色
-        info_pattern = QRegularExpression(r'INFO|Info|info')
-        self.highlighting_rules.append((info_pattern, info_format))
+        rules.append(('info', r'\binfo\b', info_format))
         
         # 调试格式
         debug_format = QTextCharFormat()
         debug_format.setForeground(QColor(128, 128, 128))  # 灰色
-        debug_pattern = QRegularExpression(r'DEBUG|Debug|debug')
-        self.highlighting_rules.append((debug_pattern, debug_format))
+        rules.append(('debug', r'\bdebug\b', debug_format))
         
         # Vortex标识
         vortex_format = QTextCharFormat()
         vortex_format.setForeground(QColor(0, 0, 255))  # 蓝色
         vortex_format.setFontWeight(QFont.Weight.Bold)
-        vortex_pattern = QRegularExpression(r'Vortex-Launcher')
-        self.highlighting_rules.append((vortex_pattern, vortex_format))
+        rules.append(('vortex', r'(?-i:Vortex-Launcher)', vortex_format))
         
         # Blender标识
         blender_format = QTextCharFormat()
         blender_format.setForeground(QColor(128, 0, 128))  # 紫色
         blender_format.setFontWeight(QFont.Weight.Bold)
-        blender_pattern = QRegularExpression(r'Blender')
-        self.highlighting_rules.append((blender_pattern, blender_format))
+        rules.append(('blender', r'(?-i:Blender)', blender_format))
+        
+        pattern = QRegularExpression(
+            '|'.join(f'(?<{name}>{regex})' for name, regex, _ in rules),
+            QRegularExpression.PatternOption.CaseInsensitiveOption
+        )
+        # 立即编译（可用时启用JIT），而不是在第一次匹配时
+        pattern.optimize()
+        
+        formats = [None] + [text_format for _, _, text_format in rules]
+        return pattern, formats
     
     def highlightBlock(self, text):
         """高亮文本块"""
-        for pattern, format in self.highlighting_rules:
-            match_iterator = pattern.globalMatch(text)
-            while match_iterator.hasNext():
-                match = match_iterator.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+        formats = self._FORMATS
+        match_iterator = self._PATTERN.globalMatch(text)
+        while match_iterator.hasNext():
+            match = match_iterator.next()
+            # 各分支互斥，最后捕获的分组即为命中的关键字类型
+            self.setFormat(match.capturedStart(), match.capturedLength(), formats[match.lastCapturedIndex()])
 
 
 class LogManager:
@@ -93,8 +164,13 @@ class LogManager:
         self.log_name_format = self.config.get('log_name_format', '%Y-%m-%d-%H%M%S')
         self.max_log_size = self.config.get('max_log_size', 10 * 1024 * 1024)  # 默认10MB
         self.compress_logs = self.config.get('compress_logs', False)
+        # 日志文本在低压缩级别下压缩率已接近最高级别，而速度快得多
+        self.compress_level = self.config.get('log_compress_level', 1)
         self.enabled = self.config.get('log_enabled', True)
         
+        # 日志文件列表缓存：((日志目录, 日志名格式, 目录修改时间), 结果)
+        self._log_files_cache = None
+        
         # 创建日志目录
         if not os.path.exists(self.log_dir):
             os.makedirs(self.log_dir)
@@ -187,23 +263,45 @@ class LogManager:
         Returns:
             dict: 按照日志类型分类的日志文件列表
         """
-        if not os.path.exists(self.log_dir):
+        try:
+            dir_mtime = os.stat(self.log_dir).st_mtime_ns
+        except FileNotFoundError:
             return {'vortex': [], 'blender': [], 'combined': []}
         
-        log_files = {'vortex': [], 'blender': [], 'combined': []}
-        for file in os.listdir(self.log_dir):
-            if file.endswith('.log') or file.endswith('.log.gz'):
-                if file.startswith('vortex-'):
-                    log_files['vortex'].append(file)
-                elif file.startswith('blender-'):
-                    log_files['blender'].append(file)
-                elif file.startswith('combined-'):
-                    log_files['combined'].append(file)
-        
-        # 按照时间排序
-        for log_type in log_files:
-            log_files[log_type].sort(reverse=True)
-        
+        # 目录内容没有变化（没有新建、删除或重命名文件）时直接返回上次的结果
+        cache_key = (self.log_dir, self.log_name_format, dir_mtime)
+        cache = self._log_files_cache
+        if cache and cache[0] == cache_key:
+            return cache[1]
+        
+        entries_by_type = {'vortex': [], 'blender': [], 'combined': []}
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                match = _LOG_NAME_RE.match(entry.name)
+                if match:
+                    entries_by_type[match.group(1)].append((match.group(2), entry))
+        
+        # 按照时间从新到旧排序：能从文件名解析出时间的文件排在前面并按该时间排序；
+        # 无法解析的文件排在后面，按修改时间排序（压缩过的日志修改时间是压缩时间，不能与会话时间混排）
+        digit_count = _sortable_digit_count(self.log_name_format)
+        log_files = {}
+        for log_type, items in entries_by_type.items():
+            keyed = []
+            for timestamp, entry in items:
+                key = _timestamp_key(timestamp, digit_count)
+                if key is not None:
+                    keyed.append((1, key, entry.name))
+                    continue
+                try:
+                    keyed.append((0, entry.stat().st_mtime_ns, entry.name))
+                except FileNotFoundError:
+                    # 扫描之后已被压缩或删除
+                    continue
+            # 排序键相同时按文件名排序
+            keyed.sort(reverse=True)
+            log_files[log_type] = [name for _, _, name in keyed]
+        
+        self._log_files_cache = (cache_key, log_files)
         return log_files
     
     def compress_old_logs(self):
@@ -211,18 +309,21 @@ class LogManager:
         if not self.compress_logs:
             return
         
-        for file in os.listdir(self.log_dir):
-            if file.endswith('.log') and not file.endswith('.log.gz'):
-                log_path = os.path.join(self.log_dir, file)
-                # 判断文件是否是今天创建的
-                file_time = os.path.getctime(log_path)
-                now = time.time()
-                # 如果文件创建时间超过24小时，则压缩
-                if now - file_time > 86400:  # 24小时 = 86400秒
-                    with open(log_path, 'rb') as f_in:
-                        with gzip.open(f"{log_path}.gz", 'wb') as f_out:
-                            shutil.copyfileobj(f_in, f_out)
-                    os.remove(log_path)
+        now = time.time()
+        with os.scandir(self.log_dir) as entries:
+            log_entries = [entry for entry in entries
+                           if entry.name.endswith('.log') and entry.is_file()]
+        
+        for entry in log_entries:
+            log_path = entry.path
+            # 判断文件是否是今天创建的（Windows下DirEntry.stat()直接使用目录项中的信息，无需额外系统调用）
+            file_time = entry.stat().st_ctime
+            # 如果文件创建时间超过24小时，则压缩
+            if now - file_time > 86400:  # 24小时 = 86400秒
+                with open(log_path, 'rb') as f_in:
+                    with gzip.open(f"{log_path}.gz", 'wb', compresslevel=self.compress_level) as f_out:
+                        shutil.copyfileobj(f_in, f_out, LOG_COPY_BUFFER_SIZE)
+                os.remove(log_path)
     
     def read_log_file(self, filename):
         """读取日志文件内容
@@ -234,8 +335,6 @@ class LogManager:
             str: 日志文件内容
         """
         file_path = os.path.join(self.log_dir, filename)
-        if not os.path.exists(file_path):
-            return "日志文件不存在"
         
         try:
             if filename.endswith('.gz'):
@@ -244,6 +343,8 @@ class LogManager:
             else:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     return f.read()
+        except FileNotFoundError:
+            return "日志文件不存在"
         except Exception as e:
             return f"读取日志文件时出错: {str(e)}"
     
@@ -258,6 +359,8 @@ class LogManager:
         self.log_name_format = self.config.get('log_name_format', '%Y-%m-%d-%H%M%S')
         self.max_log_size = self.config.get('max_log_size', 10 * 1024 * 1024)
         self.compress_logs = self.config.get('compress_logs', False)
+        # 日志文本在低压缩级别下压缩率已接近最高级别，而速度快得多
+        self.compress_level = self.config.get('log_compress_level', 1)
         self.enabled = self.config.get('log_enabled', True)
         
         # 创建日志目录
@@ -11,6 +11,9 @@
 
 import os
 import sys
+import json
+import functools
+import threading
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QMessageBox,
@@ -24,7 +27,6 @@ from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal, QTimer, QDateTime
 
 from src.log import LogViewerDialog, LogSettingsDialog
 from src.blender_manager import BlenderManager
-from src.download_manager import DownloadManager, BlenderVersionInfo
 
 
 class AboutDialog(QDialog):
@@ -473,6 +475,7 @@ class DownloadDialog(QDialog):
         # 连接信号
         self.version_table.itemSelectionChanged.connect(self.on_selection_change)
         self.download_manager.version_list_updated.connect(self.update_version_table)
+        self.download_manager.download_started.connect(self.download_started)
         self.download_manager.download_progress.connect(self.update_progress)
         self.download_manager.download_finished.connect(self.download_finished)
         self.download_manager.download_error.connect(self.download_error)
@@ -482,7 +485,6 @@ class DownloadDialog(QDialog):
         
     def refresh_versions(self):
         """刷新版本列表"""
-        from PyQt6.QtCore import QTimer
         # 禁用按钮
         self.download_button.setEnabled(False)
         self.install_button.setEnabled(False)
@@ -491,18 +493,21 @@ class DownloadDialog(QDialog):
         self.version_table.setRowCount(0)
         self.download_label.setText("正在获取版本信息...")
         
-        # 异步获取版本列表
-        QTimer.singleShot(100, self.download_manager.get_available_versions)
+        # 在后台线程中获取版本列表，结果通过version_list_updated信号返回界面线程
+        threading.Thread(
+            target=self.download_manager.get_available_versions,
+            daemon=True
+        ).start()
         
     def update_version_table(self, versions):
         """更新版本表格"""
         self.versions = versions
         self.version_table.setRowCount(0)
         
-        for version_info in versions:
-            row = self.version_table.rowCount()
-            self.version_table.insertRow(row)
-            
+        # 一次性分配所有行，避免逐行insertRow
+        self.version_table.setRowCount(len(versions))
+        
+        for row, version_info in enumerate(versions):
             self.version_table.setItem(row, 0, QTableWidgetItem(version_info.version))
             self.version_table.setItem(row, 1, QTableWidgetItem(version_info.build_date or ""))
             self.version_table.setItem(row, 2, QTableWidgetItem(version_info.size or "未知"))
@@ -526,7 +531,7 @@ class DownloadDialog(QDialog):
             self.current_download = self.download_manager.download_blender(version_info)
             
             if self.current_download:
-                self.download_label.setText(f"正在下载 Blender {version_info.version}...")
+                self._show_download_state(self.current_download)
                 self.download_button.setEnabled(False)
                 self.install_button.setEnabled(False)
                 self.cancel_button.setEnabled(True)
@@ -542,7 +547,7 @@ class DownloadDialog(QDialog):
             self.current_download = self.download_manager.download_blender(version_info)
             
             if self.current_download:
-                self.download_label.setText(f"正在下载 Blender {version_info.version}...")
+                self._show_download_state(self.current_download)
                 self.download_button.setEnabled(False)
                 self.install_button.setEnabled(False)
                 self.cancel_button.setEnabled(True)
@@ -562,11 +567,23 @@ class DownloadDialog(QDialog):
             self.cancel_button.setEnabled(False)
             self.progress_bar.setValue(0)
             
+    def _show_download_state(self, download_id):
+        """显示下载任务是在排队还是正在下载"""
+        if self.download_manager.is_download_queued(download_id):
+            self.download_label.setText(f"等待下载 Blender {download_id}（同时下载数已达上限，正在排队）...")
+        else:
+            self.download_label.setText(f"正在下载 Blender {download_id}...")
+    
+    def download_started(self, download_id):
+        """排队的下载开始"""
+        if self.current_download and download_id == self.current_download:
+            self._show_download_state(download_id)
+    
     def update_progress(self, download_id, current, total):
         """更新下载进度"""
         if self.current_download and download_id == self.current_download:
             if total > 0:
-                progress = int(current / total * 100)
+                progress = current * 100 // total
                 self.progress_bar.setValue(progress)
                 
                 # 显示下载速度和剩余时间
@@ -734,7 +751,6 @@ class LaunchingDialog(QDialog):
         self.setLayout(layout)
         
         # 启动定时器
-        from PyQt6.QtCore import QTimer
         self.timer = QTimer()
         self.timer.timeout.connect(self._update_progress)
         self.timer.start(50)  # 每50毫秒更新一次
@@ -842,7 +858,6 @@ class BlenderLaunchDialog(QDialog):
         self.setLayout(layout)
         
         # 启动定时器，延迟启动
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(100, self.start_blender)
         
         # 用于存储进程
@@ -871,20 +886,12 @@ class BlenderLaunchDialog(QDialog):
                     # 启动Blender
                     success, message = self.blender_manager.launch_blender(self.index)
                     if success:
-                        # 尝试获取进程，使用超时和重试机制
-                        import time
-                        max_attempts = 10
-                        for attempt in range(max_attempts):
-                            process = self.blender_manager.get_running_process(self.index)
-                            if process:
-                                self.started_signal.emit(process)
-                                return
-                            else:
-                                # 等待100ms后再次尝试
-                                time.sleep(0.1)
-                                
-                        # 如果所有尝试都失败
-                        self.error_signal.emit("启动成功但无法获取进程，请检查Blender是否正常运行")
+                        # launch_blender返回前已登记进程，无需轮询等待
+                        process = self.blender_manager.get_running_process(self.index)
+                        if process:
+                            self.started_signal.emit(process)
+                        else:
+                            self.error_signal.emit("Blender启动后立即退出，请检查Blender是否正常运行")
                     else:
                         self.error_signal.emit(message)
                 except Exception as e:
@@ -905,7 +912,6 @@ class BlenderLaunchDialog(QDialog):
         self.status_label.setText("Blender已启动!")
         
         # 延迟关闭
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(1000, self.accept)
     
     def on_launch_error(self, error):
@@ -913,7 +919,6 @@ class BlenderLaunchDialog(QDialog):
         if self.canceled:
             return
             
-        from PyQt6.QtWidgets import QMessageBox
         QMessageBox.critical(self, "启动失败", f"启动Blender时出错: {error}")
         self.reject()
         
@@ -938,22 +943,32 @@ class BlenderLaunchDialog(QDialog):
 
 class MainWindow(QMainWindow):
     """主窗口"""
+    # 后台卸载完成信号(是否成功, Blender路径, 消息)，从删除线程发出，在主线程处理
+    uninstall_finished = pyqtSignal(bool, str, str)
+    
     def __init__(self, config, log_manager, blender_manager):
         super().__init__()
         self.config = config
         self.log_manager = log_manager
         self.blender_manager = blender_manager
+        self.uninstall_finished.connect(self.on_uninstall_finished)
         
         # 创建日志记录器
         self.logger = self.log_manager.get_logger("MainWindow", "vortex")
         
-        # 创建下载管理器
-        self.download_manager = DownloadManager(config, self.log_manager.get_logger("DownloadManager", "vortex"))
-        
         self.logger.info("正在初始化主窗口...")
         self.initUI()
         self.logger.info("主窗口初始化完成")
 
+    @functools.cached_property
+    def download_manager(self):
+        """下载管理器，首次打开下载对话框时才创建
+        
+        同时延迟导入requests和BeautifulSoup，加快启动速度
+        """
+        from src.download_manager import DownloadManager
+        return DownloadManager(self.config, self.log_manager.get_logger("DownloadManager", "vortex"))
+
     def initUI(self):
         """初始化用户界面"""
         # 设置窗口基本属性
@@ -1113,8 +1128,9 @@ class MainWindow(QMainWindow):
             self.config['use_proxy'] = dialog.use_proxy.isChecked()
             self.config['proxy'] = dialog.proxy.text()
             
-            # 更新下载管理器配置
-            self.download_manager.update_config(self.config)
+            # 更新下载管理器配置（尚未创建时，创建时会直接读取新配置）
+            if 'download_manager' in self.__dict__:
+                self.download_manager.update_config(self.config)
             
             # 如果启用自动检测，则执行自动检测
             if self.config.get('auto_detect', False):
@@ -1157,7 +1173,6 @@ class MainWindow(QMainWindow):
                 # 确保blender_paths是最新的
                 self.config['blender_paths'] = self.blender_manager.blender_paths
                 
-                import json
                 with open(file_path, 'w', encoding='utf-8') as f:
                     json.dump(self.config, f, ensure_ascii=False, indent=4)
                 QMessageBox.information(self, "成功", "配置已成功导出")
@@ -1175,7 +1190,6 @@ class MainWindow(QMainWindow):
         if file_path:
             try:
                 self.logger.info(f"从文件导入配置: {file_path}")
-                import json
                 with open(file_path, 'r', encoding='utf-8') as f:
                     imported_config = json.load(f)
                     
@@ -1237,14 +1251,16 @@ class MainWindow(QMainWindow):
         self.logger.debug("更新版本表格")
         self.version_table.setRowCount(0)
         
-        for idx, path in enumerate(self.blender_manager.blender_paths):
-            # 获取Blender信息
-            info = self.blender_manager.get_blender_info(idx)
-            if info:
-                row = self.version_table.rowCount()
-                self.version_table.insertRow(row)
-                self.version_table.setItem(row, 0, QTableWidgetItem(info['version']))
-                self.version_table.setItem(row, 1, QTableWidgetItem(info['path']))
+        # 并行获取所有Blender的版本信息
+        paths = list(self.blender_manager.blender_paths)
+        versions = self.blender_manager.get_blender_versions(paths)
+        
+        # 一次性分配所有行，避免逐行insertRow
+        self.version_table.setRowCount(len(paths))
+        
+        for row, (path, version) in enumerate(zip(paths, versions)):
+            self.version_table.setItem(row, 0, QTableWidgetItem(version))
+            self.version_table.setItem(row, 1, QTableWidgetItem(path))
 
     def add_blender(self):
         """添加Blender地址"""
@@ -1300,18 +1316,32 @@ class MainWindow(QMainWindow):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.Yes:
-                success, message = self.blender_manager.uninstall_blender(current_row)
+                success, message = self.blender_manager.uninstall_blender(
+                    current_row, self.uninstall_finished.emit
+                )
                 if success:
-                    self.logger.info(f"成功卸载Blender: {path}")
-                    self.update_version_table()
-                    QMessageBox.information(self, "成功", "Blender已成功卸载")
+                    self.logger.info(f"开始卸载Blender: {path}")
                 else:
                     self.logger.warning(f"卸载Blender失败: {message}")
+                    self.update_version_table()
                     QMessageBox.warning(self, "警告", message)
         else:
             self.logger.warning("尝试卸载Blender，但没有选择任何行")
             QMessageBox.information(self, "信息", "请先选择一个Blender版本")
 
+    def on_uninstall_finished(self, success, path, message):
+        """后台卸载完成，删除成功时才移除列表项"""
+        if success:
+            self.blender_manager.remove_blender_path(path)
+            self.logger.info(f"成功卸载Blender: {path}")
+            self.update_version_table()
+            QMessageBox.information(self, "成功", message)
+        else:
+            # 保留列表项，用户可以处理后再次卸载
+            self.logger.warning(f"卸载Blender失败: {message}")
+            self.update_version_table()
+            QMessageBox.warning(self, "警告", f"{message}\n{path}")
+
     def launch_blender(self):
         """启动选中的Blender版本"""
         current_row = self.version_table.currentRow()
@@ -1380,8 +1410,10 @@ class MainWindow(QMainWindow):
         # 确保blender_paths是最新的
         self.config['blender_paths'] = self.blender_manager.blender_paths
         
+        # 写入尚未保存的版本缓存
+        self.blender_manager.save_version_cache()
+        
         # 保存配置
-        import json
         try:
             with open("config.json", 'w', encoding='utf-8') as f:
                 json.dump(self.config, f, ensure_ascii=False, indent=4)
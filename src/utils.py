@@ -50,11 +50,13 @@ def write_json_file(file_path, data):
     """
     try:
         directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        # 先完整序列化再一次性写入，json.dump会对每个片段分别调用write
+        content = json.dumps(data, ensure_ascii=False, indent=4)
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write(content)
         return True
     except Exception as e:
         print(f"写入JSON文件出错: {str(e)}")